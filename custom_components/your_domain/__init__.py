@@ -6,25 +6,31 @@ See quality_scale.yaml for compliance tracking.
 
 from __future__ import annotations
 
-import logging
 from dataclasses import dataclass
+import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv
 
-from .api.client import YourDomainApiClient
 from .api.exceptions import (
     YourDomainApiAuthenticationError,
     YourDomainApiCommunicationError,
 )
+from .api.registry import async_get_client, async_release_client
 from .const import DOMAIN
 from .coordinator import YourDomainCoordinator
+from .coordinator.history import async_remove_history
+from .coordinator.liveness import YourDomainLivenessProbe
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+    from .api.client import YourDomainApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +42,8 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Type alias for config entry (Platinum: strict-typing)
 type YourDomainConfigEntry = ConfigEntry[YourDomainData]
 
@@ -46,6 +54,16 @@ class YourDomainData:
 
     coordinator: YourDomainCoordinator
     client: YourDomainApiClient
+    probe: YourDomainLivenessProbe
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration.
+
+    Bronze: action-setup - Register services once, not per entry.
+    """
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -57,15 +75,11 @@ async def async_setup_entry(
     Bronze: test-before-setup - Check connectivity before setup.
     Platinum: inject-websession - Pass session to client.
     """
-    # Platinum: inject-websession - Get session from Home Assistant
-    session = async_get_clientsession(hass)
+    # Platinum: inject-websession - Shared client uses HA's session
+    client = async_get_client(hass, entry.data[CONF_HOST])
 
-    client = YourDomainApiClient(
-        host=entry.data[CONF_HOST],
-        session=session,
-    )
-
-    # Bronze: test-before-setup - Validate connection
+    # Bronze: test-before-setup - Validate connection (reuses a recent
+    # validation from the config flow or a previous setup)
     try:
         await client.async_validate_connection()
     except YourDomainApiAuthenticationError as err:
@@ -85,18 +99,38 @@ async def async_setup_entry(
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
+    # Liveness - Fast outage detection, independent of the data poll
+    probe = YourDomainLivenessProbe(hass, coordinator)
+    probe.async_start()
+    entry.async_on_unload(probe.async_stop)
+
     # Bronze: runtime-data - Store in runtime_data, NOT hass.data
     entry.runtime_data = YourDomainData(
         coordinator=coordinator,
         client=client,
+        probe=probe,
     )
 
+    # Apply option changes live instead of reloading
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def _async_update_listener(
+    hass: HomeAssistant,
+    entry: YourDomainConfigEntry,
+) -> None:
+    """Apply changed options to the running entry.
+
+    Host changes are reloaded by the reconfigure flow.
+    """
+    entry.runtime_data.coordinator.async_apply_options()
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: YourDomainConfigEntry,
@@ -106,3 +140,12 @@ async def async_unload_entry(
     Silver: config-entry-unloading - Support unloading.
     """
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: YourDomainConfigEntry,
+) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    async_release_client(hass, entry.data[CONF_HOST])
+    await async_remove_history(hass, entry.entry_id)
@@ -8,10 +8,12 @@ from .exceptions import (
     YourDomainApiCommunicationError,
     YourDomainApiError,
 )
+from .priority import RequestPriority
 
 __all__ = [
-    "YourDomainApiClient",
+    "RequestPriority",
     "YourDomainApiAuthenticationError",
+    "YourDomainApiClient",
     "YourDomainApiCommunicationError",
     "YourDomainApiError",
 ]
@@ -3,21 +3,31 @@
 Platinum requirements:
 - async-dependency: All operations are async
 - inject-websession: Session is injected, not created
+
+Requests to the device pass a priority scheduler, so commands are not
+stuck behind polls. Liveness probes queue there too, so they never compete
+with a request the device is still serving.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+from functools import partial
+import json
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from aiohttp import ClientError
 
 from .exceptions import (
     YourDomainApiAuthenticationError,
     YourDomainApiCommunicationError,
     YourDomainApiError,
 )
+from .priority import RequestPriority, RequestScheduler
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from aiohttp import ClientResponse, ClientSession
 
 
 class YourDomainApiClient:
@@ -31,7 +41,11 @@ class YourDomainApiClient:
         self,
         host: str,
         session: ClientSession,
-        timeout: int = 10,
+        timeout: float = 10,
+        status_ttl: float = 30,
+        offload_bytes: int = 65536,
+        max_concurrent_requests: int = 1,
+        probe_timeout: float = 2,
     ) -> None:
         """Initialize the API client.
 
@@ -39,20 +53,57 @@ class YourDomainApiClient:
             host: The host address of the device.
             session: aiohttp ClientSession (injected from HA).
             timeout: Request timeout in seconds.
+            status_ttl: Seconds a successful validation is reused.
+            offload_bytes: Bodies of at least this size are decoded in
+                an executor instead of on the event loop.
+            max_concurrent_requests: Requests the device serves at once.
+            probe_timeout: Liveness probe timeout in seconds, usually far
+                below the request timeout.
 
         """
         self._host = host
         self._session = session  # Platinum: inject-websession
         self._timeout = timeout
 
+        # Validation cache - Time of the last successful /api/status request
+        self._status_ttl = status_ttl
+        self._status_time: float | None = None
+
+        # Executor offload - Large bodies are decoded off the event loop
+        self._offload_bytes = offload_bytes
+
+        # Request priorities - Commands pre-empt polls
+        self._requests = RequestScheduler(max_concurrent_requests)
+
+        # Liveness - Probe timeout and time of the last successful response
+        self._probe_timeout = probe_timeout
+        self._last_response: float | None = None
+
     @property
     def host(self) -> str:
         """Return the host address."""
         return self._host
 
-    async def async_validate_connection(self) -> bool:
+    @property
+    def timeout(self) -> float:
+        """Return the request timeout in seconds."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        """Set the request timeout, effective from the next request."""
+        self._timeout = value
+
+    async def async_validate_connection(self, max_age: float | None = None) -> bool:
         """Validate the connection to the device.
 
+        A successful validation is reused for status_ttl seconds, so a
+        config flow followed by entry setup only validates once.
+
+        Args:
+            max_age: Maximum age of a cached result in seconds, defaults
+                to status_ttl. Pass 0 to force a round trip.
+
         Returns:
             True if connection is valid.
 
@@ -61,26 +112,157 @@ class YourDomainApiClient:
             YourDomainApiCommunicationError: Cannot connect.
 
         """
-        return await self._async_request("GET", "/api/status")
+        if max_age is None:
+            max_age = self._status_ttl
+        if (
+            self._status_time is not None
+            and time.monotonic() - self._status_time < max_age
+        ):
+            return True
+
+        await self._async_request(
+            "GET", "/api/status", priority=RequestPriority.CONFIRM
+        )
+        self._status_time = time.monotonic()
+        return True
+
+    def invalidate_status(self) -> None:
+        """Drop the cached validation result."""
+        self._status_time = None
+
+    async def async_probe(self) -> bool:
+        """Check that the device answers at all.
+
+        The probe waits for a free request slot like any other request, and
+        the timeout only starts once it has one. A request that completed
+        while the probe was waiting already proves the device is up.
+        Otherwise a HEAD request without a body to decode is sent, and any
+        answer below 500, including an authentication error, counts.
+
+        Returns:
+            True if the device answered in time.
+
+        """
+        queued = time.monotonic()
+        return await self._requests.async_run(
+            RequestPriority.PROBE, partial(self._async_head, queued)
+        )
+
+    async def _async_head(self, queued: float) -> bool:
+        """Send the probe unless the device answered since it was queued."""
+        if self._last_response is not None and self._last_response >= queued:
+            return True
+        try:
+            async with asyncio.timeout(self._probe_timeout):
+                async with self._session.head(
+                    f"http://{self._host}/api/status"
+                ) as response:
+                    return response.status < 500
+        except (TimeoutError, ClientError):
+            return False
 
-    async def async_get_data(self) -> dict[str, Any]:
+    async def async_get_data(
+        self,
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> tuple[Any, float]:
         """Get device data.
 
+        Args:
+            priority: CONFIRM when reading back the result of a command.
+
+        Returns:
+            Device data and the seconds spent decoding it on the event loop.
+
+        Raises:
+            YourDomainApiError: On any API error.
+
+        """
+        return await self._async_request("GET", "/api/data", priority=priority)
+
+    async def async_send_command(
+        self,
+        command: str,
+        data: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send a command ahead of any queued or in-flight poll.
+
+        Args:
+            command: Command name.
+            data: Optional command arguments.
+
         Returns:
-            Device data dictionary.
+            Response data.
 
         Raises:
             YourDomainApiError: On any API error.
 
         """
-        return await self._async_request("GET", "/api/data")
+        result, _ = await self._async_request(
+            "POST",
+            f"/api/command/{command}",
+            data,
+            priority=RequestPriority.COMMAND,
+        )
+        return result
+
+    async def async_get_history(
+        self,
+        start: int,
+        end: int,
+        page: int = 0,
+        limit: int = 1000,
+    ) -> dict[str, Any]:
+        """Get one page of the device-side sample buffer.
+
+        Args:
+            start: Window start as a UNIX timestamp (inclusive).
+            end: Window end as a UNIX timestamp (exclusive).
+            page: Zero-based page index.
+            limit: Maximum number of samples per page.
+
+        Returns:
+            Dictionary with "samples" ([timestamp, value] pairs) and
+            "next_page" (None on the last page).
+
+        Raises:
+            YourDomainApiError: On any API error.
+
+        """
+        history, _ = await self._async_request(
+            "GET",
+            f"/api/history?start={start}&end={end}&page={page}&limit={limit}",
+        )
+        return cast("dict[str, Any]", history)
 
     async def _async_request(
         self,
         method: str,
         path: str,
         data: dict[str, Any] | None = None,
-    ) -> Any:
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> tuple[Any, float]:
+        """Make an async request once the scheduler grants a slot.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            data: Optional request data.
+            priority: Priority class of the request.
+
+        Returns:
+            Response data and the seconds spent decoding it on the event loop.
+
+        """
+        return await self._requests.async_run(
+            priority, partial(self._async_send, method, path, data)
+        )
+
+    async def _async_send(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None = None,
+    ) -> tuple[Any, float]:
         """Make an async request.
 
         Platinum: async-dependency - Uses asyncio.timeout (NOT async_timeout).
@@ -91,7 +273,7 @@ class YourDomainApiClient:
             data: Optional request data.
 
         Returns:
-            Response data.
+            Response data and the seconds spent decoding it on the event loop.
 
         Raises:
             YourDomainApiAuthenticationError: On auth errors (401/403).
@@ -109,25 +291,66 @@ class YourDomainApiClient:
                     url,
                     json=data,
                 ) as response:
-                    if response.status in (401, 403):
-                        raise YourDomainApiAuthenticationError(
-                            f"Authentication failed: {response.status}"
-                        )
-
-                    if response.status >= 400:
-                        raise YourDomainApiError(
-                            f"API error: {response.status}"
-                        )
-
-                    return await response.json()
+                    self._raise_for_status(response)
+                    decoded = await self._async_decode(response)
+                    self._last_response = time.monotonic()
+                    return decoded
 
         except TimeoutError as err:
+            self.invalidate_status()
             raise YourDomainApiCommunicationError(
                 f"Timeout connecting to {self._host}"
             ) from err
         except YourDomainApiError:
             raise
         except Exception as err:
+            self.invalidate_status()
             raise YourDomainApiCommunicationError(
                 f"Error communicating with {self._host}: {err}"
             ) from err
+
+    def _raise_for_status(self, response: ClientResponse) -> None:
+        """Raise if the response has an error status.
+
+        Raises:
+            YourDomainApiAuthenticationError: On auth errors (401/403).
+            YourDomainApiError: On other errors.
+
+        """
+        if response.status in (401, 403):
+            self.invalidate_status()
+            raise YourDomainApiAuthenticationError(
+                f"Authentication failed: {response.status}"
+            )
+
+        if response.status >= 400:
+            raise YourDomainApiError(f"API error: {response.status}")
+
+    async def _async_decode(self, response: ClientResponse) -> tuple[Any, float]:
+        """Decode a JSON response body.
+
+        Bodies of at least offload_bytes are decoded in the default executor.
+        The timing is returned with the data, since concurrent requests
+        share the client.
+
+        Args:
+            response: Response with a successful status.
+
+        Returns:
+            Decoded response data, None for an empty body, and the seconds
+            spent decoding on the event loop.
+
+        """
+        body = await response.read()
+        if not body.strip():
+            return None, 0.0
+
+        if len(body) >= self._offload_bytes:
+            data = await asyncio.get_running_loop().run_in_executor(
+                None, json.loads, body
+            )
+            return data, 0.0
+
+        start = time.perf_counter()
+        data = json.loads(body)
+        return data, time.perf_counter() - start
@@ -0,0 +1,115 @@
+"""Per-device request scheduling for Your Domain.
+
+Devices serve one request at a time, so a user command could wait behind
+a slow poll. Requests therefore pass a small priority scheduler: waiting
+requests are served in priority order, and a command that finds every slot
+taken cancels an in-flight poll. The cancelled poll is queued again and
+retried once the command is done; its caller never sees the cancellation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class RequestPriority(IntEnum):
+    """Priority classes of device requests, lower is served first."""
+
+    COMMAND = 0
+    CONFIRM = 1
+    PROBE = 2
+    POLL = 3
+
+
+class RequestScheduler:
+    """Limit concurrent requests to one device and serve them by priority."""
+
+    def __init__(self, limit: int = 1) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            limit: Maximum number of requests in flight.
+
+        """
+        self._limit = limit
+        self._in_use = 0
+        self._counter = itertools.count()
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future[None]]] = []
+        self._active: dict[asyncio.Task[object], RequestPriority] = {}
+        self._preempted: set[asyncio.Task[object]] = set()
+
+    async def async_run[T](
+        self,
+        priority: RequestPriority,
+        request: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run a request once a slot is free.
+
+        Args:
+            priority: Priority class of the request.
+            request: Factory of the request coroutine. It is called again
+                when a preempted poll is retried.
+
+        Returns:
+            The result of the request.
+
+        """
+        while True:
+            await self._async_acquire(priority)
+            task: asyncio.Task[T] = asyncio.ensure_future(request())
+            self._active[task] = priority
+            try:
+                return await task
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if task not in self._preempted or (
+                    current is not None and current.cancelling()
+                ):
+                    raise
+            finally:
+                self._preempted.discard(task)
+                del self._active[task]
+                self._release()
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for a slot, preempting a poll for commands."""
+        if self._in_use < self._limit and not self._waiters:
+            self._in_use += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        if priority is RequestPriority.COMMAND:
+            self._preempt_poll()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot was granted just before the caller was cancelled
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _preempt_poll(self) -> None:
+        """Cancel one in-flight poll, if any."""
+        for task, priority in self._active.items():
+            if priority is RequestPriority.POLL and task not in self._preempted:
+                self._preempted.add(task)
+                task.cancel()
+                return
+
+    def _release(self) -> None:
+        """Free a slot and hand it to the most urgent waiter."""
+        self._in_use -= 1
+        while self._waiters and self._in_use < self._limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._in_use += 1
+                future.set_result(None)
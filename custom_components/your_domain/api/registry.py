@@ -0,0 +1,70 @@
+"""Shared API clients for Your Domain.
+
+Config flows and config entries that talk to the same host share one
+client, and with it the cached result of the last connection validation.
+This avoids validating the same device again on onboarding, reload and
+reconfigure.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.hass_dict import HassKey
+
+from ..const import (
+    DOMAIN,
+    MAX_DEVICE_REQUESTS,
+    OFFLOAD_PAYLOAD_BYTES,
+    PROBE_TIMEOUT,
+    STATUS_CACHE_TTL,
+)
+from .client import YourDomainApiClient
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_CLIENTS: HassKey[dict[str, YourDomainApiClient]] = HassKey(f"{DOMAIN}_clients")
+
+
+@callback
+def async_get_client(hass: HomeAssistant, host: str) -> YourDomainApiClient:
+    """Return the shared client for a host, creating it on first use.
+
+    Platinum: inject-websession - Clients use Home Assistant's session.
+    """
+    clients = hass.data.setdefault(DATA_CLIENTS, {})
+    if (client := clients.get(host)) is None:
+        client = clients[host] = YourDomainApiClient(
+            host=host,
+            session=async_get_clientsession(hass),
+            status_ttl=STATUS_CACHE_TTL,
+            offload_bytes=OFFLOAD_PAYLOAD_BYTES,
+            max_concurrent_requests=MAX_DEVICE_REQUESTS,
+            probe_timeout=PROBE_TIMEOUT,
+        )
+    return client
+
+
+@callback
+def async_release_client(hass: HomeAssistant, host: str) -> None:
+    """Forget the shared client for a host."""
+    if clients := hass.data.get(DATA_CLIENTS):
+        clients.pop(host, None)
+
+
+@callback
+def async_release_unused_client(hass: HomeAssistant, host: str) -> None:
+    """Forget the shared client for a host unless a config entry uses it.
+
+    Flows call this when validation fails, so clients of mistyped hosts or
+    abandoned flows are not kept for the lifetime of Home Assistant.
+    """
+    if not any(
+        entry.data.get(CONF_HOST) == host
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ):
+        async_release_client(hass, host)
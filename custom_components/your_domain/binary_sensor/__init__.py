@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .. import YourDomainConfigEntry
+    from ..coordinator import YourDomainCoordinator
+    from ..coordinator.liveness import YourDomainLivenessProbe
 
 BINARY_SENSORS: tuple[BinarySensorEntityDescription, ...] = (
     BinarySensorEntityDescription(
@@ -34,16 +36,41 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensor platform."""
     coordinator = entry.runtime_data.coordinator
+    probe = entry.runtime_data.probe
     async_add_entities(
-        YourDomainBinarySensor(coordinator, description)
+        YourDomainBinarySensor(coordinator, description, probe)
         for description in BINARY_SENSORS
     )
 
 
 class YourDomainBinarySensor(YourDomainEntity, BinarySensorEntity):
-    """Binary sensor entity for Your Domain."""
+    """Binary sensor entity for Your Domain.
+
+    Connectivity follows the liveness probe, not the data poll, and stays
+    available while the device is down.
+    """
+
+    def __init__(
+        self,
+        coordinator: YourDomainCoordinator,
+        description: BinarySensorEntityDescription,
+        probe: YourDomainLivenessProbe,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, description)
+        self._probe = probe
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to liveness changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._probe.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def available(self) -> bool:
+        """Return True, connectivity is known even when the device is down."""
+        return True
 
     @property
     def is_on(self) -> bool:
         """Return true if connected."""
-        return self.coordinator.last_update_success
+        return self._probe.is_alive
@@ -30,8 +30,7 @@ async def async_setup_entry(
     """Set up button platform."""
     coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        YourDomainButton(coordinator, description)
-        for description in BUTTONS
+        YourDomainButton(coordinator, description) for description in BUTTONS
     )
 
 
@@ -39,5 +38,5 @@ class YourDomainButton(YourDomainEntity, ButtonEntity):
     """Button entity for Your Domain."""
 
     async def async_press(self) -> None:
-        """Handle button press."""
-        await self.coordinator.async_request_refresh()
+        """Send the button's command to the device."""
+        await self.coordinator.async_send_command(self.entity_description.key)
@@ -12,28 +12,40 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import voluptuous as vol
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.const import CONF_HOST
-from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, CONF_TIMEOUT
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     TextSelector,
     TextSelectorConfig,
     TextSelectorType,
 )
+import voluptuous as vol
 
-from .api.client import YourDomainApiClient
 from .api.exceptions import (
     YourDomainApiAuthenticationError,
     YourDomainApiCommunicationError,
 )
-from .const import DOMAIN
+from .api.registry import (
+    async_get_client,
+    async_release_client,
+    async_release_unused_client,
+)
+from .const import (
+    CONF_DEADBAND,
+    DEFAULT_DEADBAND,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,6 +57,63 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): NumberSelector(
+            NumberSelectorConfig(
+                min=5,
+                max=3600,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=60,
+                unit_of_measurement="s",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(CONF_DEADBAND, default=DEFAULT_DEADBAND): NumberSelector(
+            NumberSelectorConfig(
+                min=0,
+                step="any",
+                mode=NumberSelectorMode.BOX,
+            )
+        ),
+    }
+)
+
+
+async def _async_validate_host(
+    hass: HomeAssistant,
+    host: str,
+    max_age: float | None = None,
+) -> str | None:
+    """Validate the connection to a host.
+
+    Bronze: test-before-configure
+
+    Returns:
+        The error key, or None if the connection is valid.
+    """
+    client = async_get_client(hass, host)
+    try:
+        await client.async_validate_connection(max_age)
+    except YourDomainApiAuthenticationError:
+        error = "invalid_auth"
+    except YourDomainApiCommunicationError:
+        error = "cannot_connect"
+    except Exception:
+        _LOGGER.exception("Unexpected exception")
+        error = "unknown"
+    else:
+        return None
+
+    async_release_unused_client(hass, host)
+    return error
+
 
 class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Your Domain."""
@@ -64,21 +133,9 @@ class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
             self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
 
             # Bronze: test-before-configure
-            session = async_get_clientsession(self.hass)
-            client = YourDomainApiClient(
-                host=user_input[CONF_HOST],
-                session=session,
-            )
-
-            try:
-                await client.async_validate_connection()
-            except YourDomainApiAuthenticationError:
-                errors["base"] = "invalid_auth"
-            except YourDomainApiCommunicationError:
-                errors["base"] = "cannot_connect"
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+            error = await _async_validate_host(self.hass, user_input[CONF_HOST])
+            if error is not None:
+                errors["base"] = error
             else:
                 await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
@@ -110,18 +167,12 @@ class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             reauth_entry = self._get_reauth_entry()
-            session = async_get_clientsession(self.hass)
-            client = YourDomainApiClient(
-                host=reauth_entry.data[CONF_HOST],
-                session=session,
+            # Always revalidate, a cached result predates the failure
+            error = await _async_validate_host(
+                self.hass, reauth_entry.data[CONF_HOST], max_age=0
             )
-
-            try:
-                await client.async_validate_connection()
-            except YourDomainApiAuthenticationError:
-                errors["base"] = "invalid_auth"
-            except YourDomainApiCommunicationError:
-                errors["base"] = "cannot_connect"
+            if error is not None:
+                errors["base"] = error
             else:
                 return self.async_update_reload_and_abort(
                     reauth_entry,
@@ -142,23 +193,20 @@ class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            client = YourDomainApiClient(
-                host=user_input[CONF_HOST],
-                session=session,
-            )
-
-            try:
-                await client.async_validate_connection()
-            except YourDomainApiAuthenticationError:
-                errors["base"] = "invalid_auth"
-            except YourDomainApiCommunicationError:
-                errors["base"] = "cannot_connect"
+            error = await _async_validate_host(self.hass, user_input[CONF_HOST])
+            if error is not None:
+                errors["base"] = error
             else:
+                # Only a host change needs a reload, which also covers an
+                # entry that is still retrying setup against the old host
                 reconfigure_entry = self._get_reconfigure_entry()
+                old_host = reconfigure_entry.data[CONF_HOST]
+                if user_input[CONF_HOST] != old_host:
+                    async_release_client(self.hass, old_host)
                 return self.async_update_reload_and_abort(
                     reconfigure_entry,
                     data={**reconfigure_entry.data, **user_input},
+                    reload_even_if_entry_is_unchanged=False,
                 )
 
         reconfigure_entry = self._get_reconfigure_entry()
@@ -169,9 +217,7 @@ class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_HOST,
                         default=reconfigure_entry.data.get(CONF_HOST),
-                    ): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEXT)
-                    ),
+                    ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
                 }
             ),
             errors=errors,
@@ -187,7 +233,11 @@ class YourDomainConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
 class YourDomainOptionsFlow(OptionsFlow):
-    """Handle options flow."""
+    """Handle options flow.
+
+    Options are applied to the running entry by the update listener,
+    without a reload.
+    """
 
     async def async_step_init(
         self,
@@ -199,5 +249,7 @@ class YourDomainOptionsFlow(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({}),
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
         )
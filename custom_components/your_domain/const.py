@@ -6,6 +6,51 @@ from typing import Final
 
 DOMAIN: Final = "your_domain"
 
+# Options
+CONF_DEADBAND: Final = "deadband"
+
 # Default values
 DEFAULT_SCAN_INTERVAL: Final = 30
 DEFAULT_TIMEOUT: Final = 10
+DEFAULT_DEADBAND: Final = 0.0
+
+# Seconds a successful connection validation is reused
+STATUS_CACHE_TTL: Final = 30
+
+# Maximum number of scheduled refreshes in flight across all entries
+MAX_CONCURRENT_REFRESHES: Final = 4
+
+# Requests a single device serves at once
+MAX_DEVICE_REQUESTS: Final = 1
+
+# Liveness probe
+PROBE_INTERVAL: Final = 5
+PROBE_TIMEOUT: Final = 2
+PROBE_FAILURE_THRESHOLD: Final = 2
+
+# Sample buffers: statistics window in seconds, and an upper bound on the
+# samples kept per channel (buffers are sized to hold one window)
+SAMPLE_WINDOW: Final = 300
+SAMPLE_BUFFER_MAX_CAPACITY: Final = 65536
+SAMPLE_PERCENTILE: Final = 95
+
+# Executor offload: payloads from these sizes are processed off the event
+# loop, and the on-loop time of the last refreshes is kept for diagnostics
+OFFLOAD_PAYLOAD_BYTES: Final = 65536
+OFFLOAD_SAMPLES: Final = 5000
+LOOP_BLOCKING_HISTORY: Final = 100
+
+# History backfill
+HISTORY_PAGE_SIZE: Final = 1000
+HISTORY_MAX_BACKFILL_HOURS: Final = 168
+
+# Profiling: runs of profile files kept per entry in the config directory
+PROFILE_KEEP_RUNS: Final = 3
+
+# Diagnostics truncation
+DIAGNOSTICS_MAX_ITEMS: Final = 50
+DIAGNOSTICS_SAMPLE_ITEMS: Final = 5
+DIAGNOSTICS_MAX_STRING: Final = 1024
+
+# Storage
+STORAGE_VERSION: Final = 1
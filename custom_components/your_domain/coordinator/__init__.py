@@ -1,30 +1,61 @@
 """DataUpdateCoordinator for Your Domain.
 
 Silver: log-when-unavailable - Log once on disconnect/reconnect.
+History gaps from outages are backfilled into long-term statistics.
+High-rate sample arrays are reduced to windowed statistics in ring buffers.
+Large payloads are decoded and transformed in an executor.
+Commands are sent ahead of polls and read back with confirm priority.
+Scheduled polls are staggered across entries by the domain poll scheduler
+and paused while the liveness probe reports the device down.
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 import logging
-from datetime import timedelta
+import time
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TIMEOUT
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api.exceptions import (
+from ..api.exceptions import (
     YourDomainApiAuthenticationError,
     YourDomainApiCommunicationError,
+    YourDomainApiError,
 )
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from ..api.priority import RequestPriority
+from ..const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    LOOP_BLOCKING_HISTORY,
+    OFFLOAD_SAMPLES,
+)
+from .buffers import YourDomainSampleBuffers
+from .history import YourDomainHistorySync
+from .scheduler import async_get_poll_scheduler
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
-    from .api.client import YourDomainApiClient
+    from ..api.client import YourDomainApiClient
+    from .profiler import YourDomainProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request priority of the refresh running in the current task
+_REFRESH_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    f"{DOMAIN}_refresh_priority", default=RequestPriority.POLL
+)
+
 
 class YourDomainCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Your Domain.
@@ -53,23 +84,216 @@ class YourDomainCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Silver: log-when-unavailable - Track if we logged unavailable
         self._unavailable_logged: bool = False
 
+        # History backfill - Track the outage window to import afterwards
+        self.history = YourDomainHistorySync(hass, client, entry)
+        self._last_success: datetime | None = None
+        self._outage_start: datetime | None = None
+
+        # Profiling - Active session and summary of the last one
+        self.profiler: YourDomainProfiler | None = None
+        self.last_profile: dict[str, Any] | None = None
+
+        # Staggered polling - Register for a domain-wide poll phase
+        self._poll_scheduler = async_get_poll_scheduler(hass)
+        self._unregister_poll = self._poll_scheduler.async_register(
+            entry.entry_id, self._async_reschedule
+        )
+        # Loop time the next slot must come after: one interval after the
+        # first refresh, then the slot of the last scheduled refresh
+        self._not_before: float | None = None
+        self._next_slot: float = 0.0
+
+        # Sample buffers - Raw samples never reach coordinator.data
+        self.buffers = YourDomainSampleBuffers()
+
+        # Executor offload - Seconds each refresh spent processing on the loop
+        self._transform_lock = asyncio.Lock()
+        self.loop_blocking: deque[float] = deque(maxlen=LOOP_BLOCKING_HISTORY)
+        self.offloaded_refreshes: int = 0
+
+        # Liveness - Data polling is paused while the device is down
+        self._paused: bool = False
+
+        self.async_apply_options()
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply the entry's options to the running coordinator and client."""
+        options = self.config_entry.options
+        self.update_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.client.timeout = options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+        self._async_reschedule()
+
+    async def _async_setup(self) -> None:
+        """Load the persisted history cursor before the first refresh."""
+        await self.history.async_load()
+
+    async def async_shutdown(self) -> None:
+        """Release the poll phase and cancel any scheduled refresh."""
+        self._unregister_poll()
+        await super().async_shutdown()
+
+    async def _async_transform(self, data: dict[str, Any]) -> float:
+        """Move sample arrays from data into the buffers and add statistics.
+
+        Payloads with at least OFFLOAD_SAMPLES samples are processed in the
+        executor. The lock keeps the buffers to one thread at a time.
+
+        Returns:
+            Seconds spent processing on the event loop.
+        """
+        samples: dict[str, dict[str, Any]] = data.pop("samples", None) or {}
+        count = sum(len(block["values"]) for block in samples.values())
+        async with self._transform_lock:
+            if count >= OFFLOAD_SAMPLES:
+                data["statistics"] = await self.hass.async_add_executor_job(
+                    self._transform, samples
+                )
+                self.offloaded_refreshes += 1
+                return 0.0
+
+            start = time.perf_counter()
+            data["statistics"] = self._transform(samples)
+            return time.perf_counter() - start
+
+    def _transform(
+        self, samples: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, float]]:
+        """Ingest samples and return the statistics of the current window."""
+        self.buffers.ingest(samples)
+        return self.buffers.statistics(time.time())
+
+    async def async_send_command(
+        self,
+        command: str,
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        """Send a command and confirm it with a prioritized refresh.
+
+        Raises:
+            HomeAssistantError: If the device rejects or misses the command.
+        """
+        try:
+            await self.client.async_send_command(command, data)
+        except YourDomainApiAuthenticationError as err:
+            self.config_entry.async_start_reauth(self.hass)
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="auth_failed",
+            ) from err
+        except YourDomainApiError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="command_failed",
+                translation_placeholders={"command": command},
+            ) from err
+
+        await self.async_refresh_with_priority(RequestPriority.CONFIRM)
+
+    async def async_refresh_with_priority(self, priority: RequestPriority) -> None:
+        """Refresh now, requesting data at the given priority.
+
+        The priority is bound to the calling task, so scheduled refreshes
+        running at the same time keep polling at POLL priority.
+        """
+        token = _REFRESH_PRIORITY.set(priority)
+        try:
+            await self.async_refresh()
+        finally:
+            _REFRESH_PRIORITY.reset(token)
+
+    @callback
+    def async_pause(self) -> None:
+        """Pause polling and mark entities unavailable.
+
+        Called by the liveness probe, so the outage is reported within
+        seconds instead of after the next failed poll.
+        """
+        if self._shutdown_requested:
+            return
+        self._paused = True
+        self._async_unsub_refresh()
+
+        # Silver: log-when-unavailable - Log ONCE when unavailable
+        if not self._unavailable_logged:
+            _LOGGER.warning(
+                "Device %s stopped answering liveness probes",
+                self.client.host,
+            )
+            self._unavailable_logged = True
+            self._outage_start = self._last_success or dt_util.utcnow()
+
+        self.last_update_success = False
+        self.async_update_listeners()
+
+    async def async_resume(self) -> None:
+        """Resume polling with an immediate refresh."""
+        if self._shutdown_requested:
+            return
+        self._paused = False
+        await self.async_refresh()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh at this entry's staggered phase."""
+        if (
+            self._paused
+            or self.update_interval is None
+            or self.config_entry.pref_disable_polling
+        ):
+            return
+
+        self._async_unsub_refresh()
+        loop = self.hass.loop
+        interval = self.update_interval.total_seconds()
+        if self._not_before is None:
+            self._not_before = loop.time() + interval
+        self._next_slot = self._poll_scheduler.next_refresh(
+            self.config_entry.entry_id,
+            max(loop.time(), self._not_before),
+            interval,
+        )
+        self._unsub_refresh = loop.call_at(
+            self._next_slot, self._async_handle_scheduled_refresh
+        ).cancel
+
+    @callback
+    def _async_reschedule(self) -> None:
+        """Move a pending refresh to the entry's current phase."""
+        if self._unsub_refresh is not None:
+            self._schedule_refresh()
+
+    @callback
+    def _async_handle_scheduled_refresh(self) -> None:
+        """Start a scheduled refresh once a concurrency slot is free."""
+        self._unsub_refresh = None
+        # Timers may fire slightly early, never reuse the slot that fired
+        self._not_before = self._next_slot
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_staggered_refresh(),
+            f"{DOMAIN} scheduled refresh {self.client.host}",
+            eager_start=True,
+        )
+
+    async def _async_staggered_refresh(self) -> None:
+        """Run a scheduled refresh within the domain-wide concurrency cap.
+
+        The slot is held until the refresh ends, so at most
+        MAX_CONCURRENT_REFRESHES refreshes are in flight at any time.
+        """
+        async with self._poll_scheduler.semaphore:
+            await self._handle_refresh_interval()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the API.
 
         Silver: log-when-unavailable - Log once on state changes.
         """
         try:
-            data = await self.client.async_get_data()
-
-            # Silver: log-when-unavailable - Log ONCE when restored
-            if self._unavailable_logged:
-                _LOGGER.info(
-                    "Connection to %s restored",
-                    self.client.host,
-                )
-                self._unavailable_logged = False
-
-            return data
+            data, blocking = await self.client.async_get_data(_REFRESH_PRIORITY.get())
 
         except YourDomainApiAuthenticationError as err:
             # Trigger reauth flow
@@ -80,16 +304,57 @@ class YourDomainCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ) from err
 
         except YourDomainApiCommunicationError as err:
-            # Silver: log-when-unavailable - Log ONCE when unavailable
-            if not self._unavailable_logged:
-                _LOGGER.warning(
-                    "Unable to connect to %s: %s",
-                    self.client.host,
-                    err,
-                )
-                self._unavailable_logged = True
-
+            self._async_start_outage(err)
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="cannot_connect",
             ) from err
+
+        except YourDomainApiError as err:
+            # Server errors are outages too, the device buffer still has data
+            self._async_start_outage(err)
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="device_error",
+            ) from err
+
+        if not isinstance(data, dict):
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="invalid_response",
+            )
+        blocking += await self._async_transform(data)
+        self.loop_blocking.append(blocking)
+
+        # Silver: log-when-unavailable - Log ONCE when restored
+        if self._unavailable_logged:
+            _LOGGER.info(
+                "Connection to %s restored",
+                self.client.host,
+            )
+            self._unavailable_logged = False
+
+        # History backfill - Import the outage window in the background
+        if self._outage_start is not None:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.history.async_backfill(self._outage_start),
+                f"{DOMAIN} history backfill {self.client.host}",
+            )
+            self._outage_start = None
+
+        self._last_success = dt_util.utcnow()
+        return data
+
+    @callback
+    def _async_start_outage(self, err: Exception) -> None:
+        """Log an outage once and remember where to backfill from."""
+        # Silver: log-when-unavailable - Log ONCE when unavailable
+        if not self._unavailable_logged:
+            _LOGGER.warning(
+                "Unable to fetch data from %s: %s",
+                self.client.host,
+                err,
+            )
+            self._unavailable_logged = True
+            self._outage_start = self._last_success or dt_util.utcnow()
@@ -0,0 +1,209 @@
+"""Ring buffers for high-rate device samples.
+
+Devices may report sample arrays per channel next to the current value:
+
+    "samples": {"power": {"ts": 1700000000.0, "interval": 1.0, "values": [...]}}
+
+Samples are kept in ``array("d")`` ring buffers sized to hold one window at
+the channel's sample rate, and windowed statistics are derived from them on
+every refresh. Only the statistics reach the state machine, so the recorder
+never sees the individual samples.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+import logging
+import math
+from typing import Any
+
+from ..const import SAMPLE_BUFFER_MAX_CAPACITY, SAMPLE_PERCENTILE, SAMPLE_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SampleRingBuffer:
+    """Fixed-size ring buffer of timestamped samples."""
+
+    __slots__ = ("_next", "_size", "_timestamps", "_values", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the buffer."""
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered samples."""
+        return self._size
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """Return the timestamp of the newest sample."""
+        if not self._size:
+            return None
+        return self._timestamps[self._next - 1]
+
+    def extend(self, first: float, interval: float, values: list[float]) -> int:
+        """Append evenly spaced samples, skipping those already buffered.
+
+        Devices report the whole poll window, which overlaps the previous
+        report when polls are faster than the window.
+
+        Args:
+            first: Timestamp of the first sample.
+            interval: Seconds between samples.
+            values: Sample values, oldest first.
+
+        Returns:
+            The number of samples appended.
+        """
+        skip = 0
+        if (last := self.last_timestamp) is not None and last >= first:
+            if interval <= 0:
+                return 0
+            skip = math.floor((last - first) / interval) + 1
+        skip += max(0, len(values) - skip - self.capacity)
+        start = first + skip * interval
+
+        position = self._next
+        for index, value in enumerate(values[skip:]):
+            self._timestamps[position] = start + index * interval
+            self._values[position] = value
+            position = (position + 1) % self.capacity
+
+        appended = max(0, len(values) - skip)
+        self._next = position
+        self._size = min(self.capacity, self._size + appended)
+        return appended
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the newest samples."""
+        timestamps = self._ordered(self._timestamps)[-capacity:]
+        values = self._ordered(self._values)[-capacity:]
+        self.capacity = capacity
+        self._size = len(values)
+        self._next = self._size % capacity
+        self._timestamps = timestamps + array("d", bytes(8 * (capacity - self._size)))
+        self._values = values + array("d", bytes(8 * (capacity - self._size)))
+
+    def window(self, seconds: float, end: float) -> tuple[array[float], array[float]]:
+        """Return timestamps and values of the seconds up to end, oldest first."""
+        timestamps = self._ordered(self._timestamps)
+        values = self._ordered(self._values)
+        start = bisect_right(timestamps, end - seconds)
+        return timestamps[start:], values[start:]
+
+    def _ordered(self, data: array[float]) -> array[float]:
+        """Return the buffered part of data in insertion order."""
+        if self._size < self.capacity:
+            return data[: self._size]
+        return data[self._next :] + data[: self._next]
+
+
+def window_statistics(
+    timestamps: array[float],
+    values: array[float],
+    percentile: float = SAMPLE_PERCENTILE,
+) -> dict[str, float] | None:
+    """Return mean, min, max, percentile and rate of change of a window.
+
+    The rate of change is the least-squares slope in units per second,
+    which is far less noisy than the difference of the end points.
+
+    Args:
+        timestamps: Sample timestamps, oldest first.
+        values: Sample values, oldest first.
+        percentile: Percentile to report, 0 - 100.
+
+    Returns:
+        The statistics, or None for an empty window.
+    """
+    if not (count := len(values)):
+        return None
+
+    ordered = sorted(values)
+    rank = (count - 1) * percentile / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, count - 1)
+    value_at = ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+    mean = math.fsum(values) / count
+    rate = 0.0
+    if count > 1:
+        mean_ts = math.fsum(timestamps) / count
+        variance = math.fsum((ts - mean_ts) ** 2 for ts in timestamps)
+        if variance:
+            covariance = math.fsum(
+                (ts - mean_ts) * (value - mean)
+                for ts, value in zip(timestamps, values, strict=True)
+            )
+            rate = covariance / variance
+
+    return {
+        "mean": round(mean, 3),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "percentile": round(value_at, 3),
+        "rate": round(rate, 6),
+    }
+
+
+class YourDomainSampleBuffers:
+    """Per-channel sample buffers of one device."""
+
+    def __init__(
+        self,
+        max_capacity: int = SAMPLE_BUFFER_MAX_CAPACITY,
+        window: float = SAMPLE_WINDOW,
+    ) -> None:
+        """Initialize the buffers."""
+        self.max_capacity = max_capacity
+        self.window = window
+        self._channels: dict[str, SampleRingBuffer] = {}
+
+    def ingest(self, samples: dict[str, dict[str, Any]]) -> None:
+        """Append the sample arrays of one /api/data payload."""
+        for channel, block in samples.items():
+            interval = float(block["interval"])
+            capacity = self._capacity(channel, interval)
+            if (buffer := self._channels.get(channel)) is None:
+                buffer = self._channels[channel] = SampleRingBuffer(capacity)
+            elif buffer.capacity < capacity:
+                buffer.resize(capacity)
+            buffer.extend(float(block["ts"]), interval, block["values"])
+
+    def statistics(self, now: float) -> dict[str, dict[str, float]]:
+        """Return the statistics of the window ending at now, per channel.
+
+        Channels without samples in the window, for example because the
+        device stopped reporting them, are left out.
+        """
+        return {
+            channel: result
+            for channel, buffer in self._channels.items()
+            if (result := window_statistics(*buffer.window(self.window, now)))
+        }
+
+    def _capacity(self, channel: str, interval: float) -> int:
+        """Return the capacity that holds one window at the given interval."""
+        if interval <= 0:
+            return 1
+        needed = math.ceil(self.window / interval) + 1
+        if needed <= self.max_capacity:
+            return needed
+        if (buffer := self._channels.get(channel)) is None or (
+            buffer.capacity < self.max_capacity
+        ):
+            _LOGGER.warning(
+                "Channel %s samples every %s s, statistics cover only the "
+                "last %s s instead of %s s",
+                channel,
+                interval,
+                round(self.max_capacity * interval, 1),
+                self.window,
+            )
+        return self.max_capacity
@@ -0,0 +1,234 @@
+"""History backfill for Your Domain.
+
+After an outage the device-side sample buffer is fetched page by page,
+aggregated into hourly statistics and imported into the recorder in one
+batch. A persisted cursor guarantees that no hour is imported twice.
+The recorder is an optional after-dependency: without it, outages are
+not backfilled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from ..api.exceptions import YourDomainApiError
+from ..const import (
+    DOMAIN,
+    HISTORY_MAX_BACKFILL_HOURS,
+    HISTORY_PAGE_SIZE,
+    STORAGE_VERSION,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from homeassistant.components.recorder.models import StatisticData
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from ..api.client import YourDomainApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sensor whose long-term statistics are backfilled from the device buffer
+HISTORY_SENSOR_KEY = "example_sensor"
+
+# Checked by name, importing the recorder would load it for every user
+RECORDER_DOMAIN = "recorder"
+
+_HOUR = 3600
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the storage key for an entry's history cursor."""
+    return f"{DOMAIN}.{entry_id}.history"
+
+
+def _floor_hour(timestamp: float) -> int:
+    """Return the start of the hour containing timestamp."""
+    return int(timestamp // _HOUR) * _HOUR
+
+
+@dataclass(slots=True)
+class _HourBucket:
+    """Running aggregate for one hour of samples."""
+
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+
+class HourlyAggregator:
+    """Aggregate raw samples into hourly statistics.
+
+    Samples are folded into running buckets as pages arrive, so memory
+    grows with the number of hours, not with the number of samples.
+    """
+
+    def __init__(self, start: int, end: int) -> None:
+        """Initialize the aggregator for the window [start, end)."""
+        self._start = start
+        self._end = end
+        self._buckets: dict[int, _HourBucket] = {}
+
+    def add(self, samples: Iterable[Sequence[float]]) -> None:
+        """Fold [timestamp, value] pairs into their hourly buckets."""
+        buckets = self._buckets
+        for timestamp, value in samples:
+            if not self._start <= timestamp < self._end:
+                continue
+            hour = _floor_hour(timestamp)
+            if (bucket := buckets.get(hour)) is None:
+                buckets[hour] = _HourBucket(1, value, value, value)
+                continue
+            bucket.count += 1
+            bucket.total += value
+            bucket.minimum = min(bucket.minimum, value)
+            bucket.maximum = max(bucket.maximum, value)
+
+    def statistics(self) -> list[StatisticData]:
+        """Return hourly statistics ordered by start time."""
+        return [
+            {
+                "start": datetime.fromtimestamp(hour, tz=UTC),
+                "mean": bucket.total / bucket.count,
+                "min": bucket.minimum,
+                "max": bucket.maximum,
+            }
+            for hour, bucket in sorted(self._buckets.items())
+        ]
+
+
+def _async_import_hourly(
+    hass: HomeAssistant,
+    entity_id: str,
+    unit_of_measurement: str | None,
+    statistics: list[StatisticData],
+) -> None:
+    """Queue hourly statistics of a sensor for import by the recorder."""
+    # Import time - The recorder is optional and only loaded for an import
+    from homeassistant.components.recorder.models import (
+        StatisticMeanType,
+        StatisticMetaData,
+    )
+    from homeassistant.components.recorder.statistics import async_import_statistics
+
+    async_import_statistics(
+        hass,
+        StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=None,
+            source="recorder",
+            statistic_id=entity_id,
+            unit_class=None,
+            unit_of_measurement=unit_of_measurement,
+        ),
+        statistics,
+    )
+
+
+class YourDomainHistorySync:
+    """Backfill long-term statistics from the device-side sample buffer."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: YourDomainApiClient,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the history sync."""
+        self.hass = hass
+        self.client = client
+        self.config_entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry.entry_id)
+        )
+        self._lock = asyncio.Lock()
+
+        # End (exclusive) of the last imported hour, as a UNIX timestamp
+        self.cursor: int | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted cursor."""
+        if (stored := await self._store.async_load()) is not None:
+            self.cursor = stored.get("cursor")
+
+    async def async_backfill(self, since: datetime) -> None:
+        """Import all complete hours between since and now.
+
+        Hours before the cursor are skipped, so overlapping outages never
+        import the same hour twice. The cursor only advances once the
+        whole window has been fetched and handed to the recorder.
+        """
+        if RECORDER_DOMAIN not in self.hass.config.components:
+            return
+
+        async with self._lock:
+            end = _floor_hour(dt_util.utcnow().timestamp())
+            start = max(
+                _floor_hour(since.timestamp()),
+                end - HISTORY_MAX_BACKFILL_HOURS * _HOUR,
+                self.cursor or 0,
+            )
+            if start >= end:
+                return
+
+            entity_registry = er.async_get(self.hass)
+            entity_id = entity_registry.async_get_entity_id(
+                Platform.SENSOR,
+                DOMAIN,
+                f"{self.config_entry.entry_id}_{HISTORY_SENSOR_KEY}",
+            )
+            if entity_id is None:
+                return
+
+            aggregator = HourlyAggregator(start, end)
+            page: int | None = 0
+            try:
+                while page is not None:
+                    result = await self.client.async_get_history(
+                        start, end, page, HISTORY_PAGE_SIZE
+                    )
+                    aggregator.add(result.get("samples", []))
+                    page = result.get("next_page")
+            except YourDomainApiError as err:
+                _LOGGER.debug(
+                    "History backfill for %s interrupted: %s",
+                    self.client.host,
+                    err,
+                )
+                return
+
+            if statistics := aggregator.statistics():
+                entity_entry = entity_registry.async_get(entity_id)
+                _async_import_hourly(
+                    self.hass,
+                    entity_id,
+                    entity_entry.unit_of_measurement if entity_entry else None,
+                    statistics,
+                )
+                _LOGGER.debug(
+                    "Imported %s hours of history for %s",
+                    len(statistics),
+                    self.client.host,
+                )
+
+            self.cursor = end
+            await self._store.async_save({"cursor": end})
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted history cursor of a config entry."""
+    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, _storage_key(entry_id))
+    await store.async_remove()
@@ -0,0 +1,121 @@
+"""Liveness probe for Your Domain.
+
+A cheap HEAD request on a short interval detects outages within seconds,
+independent of the data poll. Probes queue behind requests the device is
+still serving, and a response to one of those counts as a successful
+probe. While the device is down the data poll is paused, and it resumes
+with an immediate refresh once the device answers again.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from ..const import DOMAIN, PROBE_FAILURE_THRESHOLD, PROBE_INTERVAL
+from .scheduler import async_get_poll_scheduler
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from homeassistant.core import HomeAssistant
+
+    from . import YourDomainCoordinator
+
+
+class YourDomainLivenessProbe:
+    """Probe device liveness and pause the data poll while it is down."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: YourDomainCoordinator,
+    ) -> None:
+        """Initialize the probe."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.is_alive = True
+        self._failures = 0
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub: CALLBACK_TYPE | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing one interval after setup, at the entry's phase.
+
+        Setup has just talked to the device, so the first probe can wait.
+        """
+        entry_id = self.coordinator.config_entry.entry_id
+        phase = async_get_poll_scheduler(self.hass).phase(entry_id)
+        self._unsub = async_call_later(
+            self.hass, (1 + phase) * PROBE_INTERVAL, self._async_start_interval
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing and cancel a probe in flight."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for liveness changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_start_interval(self, now: datetime) -> None:
+        """Probe now and then on every interval."""
+        self._unsub = async_track_time_interval(
+            self.hass,
+            self._async_start_probe,
+            timedelta(seconds=PROBE_INTERVAL),
+            name=f"{DOMAIN} liveness probe {self.coordinator.client.host}",
+            cancel_on_shutdown=True,
+        )
+        self._async_start_probe(now)
+
+    @callback
+    def _async_start_probe(self, _now: datetime) -> None:
+        """Start a probe unless the previous one is still waiting."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_probe(),
+            f"{DOMAIN} liveness probe {self.coordinator.client.host}",
+        )
+
+    async def _async_probe(self) -> None:
+        """Run one probe and act on liveness changes."""
+        if await self.coordinator.client.async_probe():
+            self._failures = 0
+            if not self.is_alive:
+                self._async_set_alive(True)
+                await self.coordinator.async_resume()
+            return
+
+        self._failures += 1
+        if self.is_alive and self._failures >= PROBE_FAILURE_THRESHOLD:
+            self._async_set_alive(False)
+            self.coordinator.async_pause()
+
+    @callback
+    def _async_set_alive(self, is_alive: bool) -> None:
+        """Update liveness and notify listeners."""
+        self.is_alive = is_alive
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,257 @@
+"""On-demand profiling of the update pipeline for Your Domain.
+
+A profiling session instruments one coordinator and its client for the
+next N refresh cycles, then restores the original methods. Nothing is
+instrumented while no session is active, so profiling costs nothing
+when it is off.
+
+Results are written to the config directory. Only the newest
+PROFILE_KEEP_RUNS runs of each entry are kept, older files are removed.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+import cProfile
+import functools
+import inspect
+import json
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from ..const import DOMAIN, PROFILE_KEEP_RUNS
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from . import YourDomainCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timed phases of a refresh cycle
+PHASE_CYCLE = "cycle"
+PHASE_UPDATE = "update"
+PHASE_REQUEST = "request"
+PHASE_DECODE = "decode"
+PHASE_DISPATCH = "dispatch"
+
+# Phases timed on the client, which is shared by everything talking to the
+# host; they only count towards the cycle that runs in the current context
+CLIENT_PHASES = frozenset({PHASE_REQUEST, PHASE_DECODE})
+
+# Timings of the profiled cycle running in the current context
+_CYCLE: ContextVar[dict[str, float] | None] = ContextVar(
+    f"{DOMAIN}_profile_cycle", default=None
+)
+
+
+def _breakdown(cycles: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    """Summarize per-cycle phase timings in milliseconds.
+
+    Network time is the request time minus decoding, processing is the
+    update time minus the request.
+    """
+    derived: list[dict[str, float]] = []
+    for cycle in cycles:
+        request = cycle.get(PHASE_REQUEST, 0.0)
+        decode = cycle.get(PHASE_DECODE, 0.0)
+        derived.append(
+            {
+                "network": request - decode,
+                "decode": decode,
+                "processing": cycle.get(PHASE_UPDATE, 0.0) - request,
+                "dispatch": cycle.get(PHASE_DISPATCH, 0.0),
+                "total": cycle.get(PHASE_CYCLE, 0.0),
+            }
+        )
+    return {
+        phase: {
+            "mean_ms": round(sum(c[phase] for c in derived) / len(derived) * 1000, 3),
+            "max_ms": round(max(c[phase] for c in derived) * 1000, 3),
+        }
+        for phase in derived[0]
+    }
+
+
+def _prune(config_dir: Path, entry_id: str) -> None:
+    """Remove all but the newest PROFILE_KEEP_RUNS runs of an entry."""
+    files = sorted(config_dir.glob(f"{DOMAIN}.profile.{entry_id}.*"))
+    stamps = sorted({file.name.split(".")[3] for file in files})
+    stale = set(stamps[:-PROFILE_KEEP_RUNS])
+    for file in files:
+        if file.name.split(".")[3] in stale:
+            file.unlink(missing_ok=True)
+
+
+class YourDomainProfiler:
+    """Profile the next refresh cycles of a coordinator.
+
+    The cycle is profiled with cProfile while it runs on the event loop.
+    Other tasks that run while the cycle awaits I/O are captured as well.
+    Phase timings only cover the cycle itself: client requests made
+    outside of it, such as probes, commands or history backfill on the
+    same host, are not counted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: YourDomainCoordinator,
+        cycles: int,
+    ) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.cycles = cycles
+        self._profile = cProfile.Profile()
+        self._timings: list[dict[str, float]] = []
+        self._current: dict[str, float] | None = None
+        self._instrumented: list[tuple[object, str]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Instrument the coordinator and client until the cycles are done."""
+        coordinator = self.coordinator
+        client = coordinator.client
+        self._instrument(coordinator, "_async_refresh", PHASE_CYCLE)
+        self._instrument(coordinator, "_async_update_data", PHASE_UPDATE)
+        self._instrument(client, "_async_request", PHASE_REQUEST)
+        self._instrument(client, "_async_decode", PHASE_DECODE)
+        self._instrument(coordinator, "async_update_listeners", PHASE_DISPATCH)
+        coordinator.profiler = self
+
+    @callback
+    def async_stop(self) -> None:
+        """Restore the original methods."""
+        for obj, name in self._instrumented:
+            delattr(obj, name)
+        self._instrumented.clear()
+        self.coordinator.profiler = None
+
+    def _instrument(self, obj: object, name: str, phase: str) -> None:
+        """Replace a bound method with a timed wrapper on the instance."""
+        original = getattr(obj, name)
+        if inspect.iscoroutinefunction(original):
+            wrapper = self._wrap_async(original, phase)
+        else:
+            wrapper = self._wrap_sync(original, phase)
+        setattr(obj, name, wrapper)
+        self._instrumented.append((obj, name))
+
+    def _wrap_async(
+        self,
+        original: Callable[..., Awaitable[Any]],
+        phase: str,
+    ) -> Callable[..., Awaitable[Any]]:
+        """Return a timed wrapper for a coroutine method."""
+
+        @functools.wraps(original)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self._async_timed(phase, original(*args, **kwargs))
+
+        return wrapper
+
+    def _wrap_sync(
+        self,
+        original: Callable[..., Any],
+        phase: str,
+    ) -> Callable[..., Any]:
+        """Return a timed wrapper for a callback method."""
+
+        @functools.wraps(original)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._record(phase, time.perf_counter() - start)
+
+        return wrapper
+
+    async def _async_timed(self, phase: str, awaitable: Awaitable[Any]) -> Any:
+        """Await and time one phase, opening and closing cycles."""
+        if phase != PHASE_CYCLE:
+            start = time.perf_counter()
+            try:
+                return await awaitable
+            finally:
+                self._record(phase, time.perf_counter() - start)
+
+        self._async_begin_cycle()
+        token = _CYCLE.set(self._current)
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record(phase, time.perf_counter() - start)
+            _CYCLE.reset(token)
+            self._async_end_cycle()
+
+    def _record(self, phase: str, elapsed: float) -> None:
+        """Add elapsed time to a phase of the current cycle."""
+        current = self._current
+        if current is None or (phase in CLIENT_PHASES and _CYCLE.get() is not current):
+            return
+        current[phase] = current.get(phase, 0.0) + elapsed
+
+    @callback
+    def _async_begin_cycle(self) -> None:
+        """Start a cycle and enable cProfile."""
+        self._current = {}
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Another profiler (e.g. the profiler integration) is active
+            _LOGGER.debug("cProfile unavailable, recording phase timings only")
+
+    @callback
+    def _async_end_cycle(self) -> None:
+        """Finish a cycle and write the results after the last one."""
+        self._profile.disable()
+        if self._current is not None:
+            self._timings.append(self._current)
+            self._current = None
+        if len(self._timings) < self.cycles:
+            return
+
+        self.async_stop()
+        self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_write_results(),
+            f"{DOMAIN} profile results {self.coordinator.client.host}",
+        )
+
+    async def _async_write_results(self) -> None:
+        """Write the stats file and phase breakdown, link them for diagnostics."""
+        entry_id = self.coordinator.config_entry.entry_id
+        stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%S")
+        base = self.hass.config.path(f"{DOMAIN}.profile.{entry_id}.{stamp}")
+        breakdown = _breakdown(self._timings)
+        summary: dict[str, Any] = {
+            "created": dt_util.utcnow().isoformat(),
+            "cycles": len(self._timings),
+            "stats_file": f"{base}.cprof",
+            "breakdown_file": f"{base}.json",
+            "phases": breakdown,
+        }
+
+        def _write() -> None:
+            self._profile.dump_stats(summary["stats_file"])
+            with open(summary["breakdown_file"], "w", encoding="utf-8") as file:
+                json.dump({**summary, "per_cycle": self._timings}, file, indent=2)
+            _prune(Path(self.hass.config.path()), entry_id)
+
+        await self.hass.async_add_executor_job(_write)
+        self.coordinator.last_profile = summary
+        _LOGGER.info(
+            "Profile of %s written to %s",
+            self.coordinator.client.host,
+            summary["stats_file"],
+        )
@@ -0,0 +1,103 @@
+"""Domain-wide poll scheduler for Your Domain.
+
+Every coordinator polls at a fixed phase within its interval. Phases are
+spread evenly over all registered entries in a deterministic order, so
+entries set up together after a restart never poll in lockstep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util.hass_dict import HassKey
+
+from ..const import DOMAIN, MAX_CONCURRENT_REFRESHES
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_POLL_SCHEDULER: HassKey[YourDomainPollScheduler] = HassKey(
+    f"{DOMAIN}_poll_scheduler"
+)
+
+
+def _stable_order(entry_id: str) -> bytes:
+    """Return a sort key that does not depend on setup order."""
+    return hashlib.blake2b(entry_id.encode(), digest_size=8).digest()
+
+
+class YourDomainPollScheduler:
+    """Assign staggered poll phases and cap concurrent refreshes."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REFRESHES) -> None:
+        """Initialize the scheduler."""
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self._reschedule: dict[str, CALLBACK_TYPE] = {}
+        self._phases: dict[str, float] = {}
+
+    @callback
+    def async_register(
+        self,
+        entry_id: str,
+        reschedule: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Register an entry and re-balance all phases.
+
+        Args:
+            entry_id: Config entry ID of the coordinator.
+            reschedule: Called whenever the entry's phase changes.
+
+        Returns:
+            Callback that unregisters the entry.
+
+        """
+        self._reschedule[entry_id] = reschedule
+        self._async_rebalance()
+
+        @callback
+        def unregister() -> None:
+            if self._reschedule.pop(entry_id, None) is not None:
+                self._async_rebalance()
+
+        return unregister
+
+    def phase(self, entry_id: str) -> float:
+        """Return the entry's phase as a fraction of its interval."""
+        return self._phases.get(entry_id, 0.0)
+
+    def next_refresh(self, entry_id: str, now: float, interval: float) -> float:
+        """Return the first slot of the entry strictly after now.
+
+        Args:
+            entry_id: Config entry ID of the coordinator.
+            now: Current event loop time.
+            interval: Poll interval in seconds.
+
+        Returns:
+            Event loop time of the next refresh.
+
+        """
+        offset = self.phase(entry_id) * interval
+        return (math.floor((now - offset) / interval) + 1) * interval + offset
+
+    @callback
+    def _async_rebalance(self) -> None:
+        """Spread phases evenly and move every entry to its new slot."""
+        order = sorted(self._reschedule, key=_stable_order)
+        self._phases = {
+            entry_id: index / len(order) for index, entry_id in enumerate(order)
+        }
+        for reschedule in list(self._reschedule.values()):
+            reschedule()
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> YourDomainPollScheduler:
+    """Return the domain-wide poll scheduler, creating it on first use."""
+    if (scheduler := hass.data.get(DATA_POLL_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLL_SCHEDULER] = YourDomainPollScheduler()
+    return scheduler
@@ -1,23 +1,173 @@
-"""Diagnostics support for Your Domain (Gold requirement)."""
+"""Diagnostics support for Your Domain (Gold requirement).
+
+Diagnostics are built in a single pass that redacts and truncates at
+once. Large arrays are summarized instead of copied, so downloads stay
+small no matter how big the device payload is. A full export streams the
+payload, redacted, to a file from the executor instead of encoding it in
+memory.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Iterator, Mapping
+import json
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.const import CONF_HOST
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DIAGNOSTICS_MAX_ITEMS,
+    DIAGNOSTICS_MAX_STRING,
+    DIAGNOSTICS_SAMPLE_ITEMS,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import YourDomainConfigEntry
+    from .coordinator import YourDomainCoordinator
+
+TO_REDACT = {CONF_HOST, "title", "unique_id"}
+
+_REDACTED_JSON = json.dumps(REDACTED)
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for int and float values, but not bool."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+class DiagnosticsBuilder:
+    """Build redacted, size-bounded diagnostics."""
+
+    def __init__(
+        self,
+        to_redact: Iterable[str] = TO_REDACT,
+        max_items: int = DIAGNOSTICS_MAX_ITEMS,
+        sample_items: int = DIAGNOSTICS_SAMPLE_ITEMS,
+        max_string: int = DIAGNOSTICS_MAX_STRING,
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            to_redact: Keys to redact, like for async_redact_data.
+            max_items: Lists longer than this are summarized.
+            sample_items: Number of items kept in a summary.
+            max_string: Strings longer than this are truncated.
+
+        """
+        self._keys = frozenset(to_redact)
+        self._max_items = max_items
+        self._sample_items = sample_items
+        self._max_string = max_string
 
-from . import YourDomainConfigEntry
+    def build(self, value: Any) -> Any:
+        """Return a redacted and truncated copy of value."""
+        if isinstance(value, Mapping):
+            keys = self._keys
+            return {
+                key: REDACTED if key in keys else self.build(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list | tuple):
+            if len(value) > self._max_items:
+                return self._summarize(value)
+            return [self.build(item) for item in value]
+        if isinstance(value, str) and len(value) > self._max_string:
+            return f"{value[: self._max_string]}... ({len(value)} chars)"
+        return value
 
-TO_REDACT = {CONF_HOST}
+    def _summarize(self, value: list[Any] | tuple[Any, ...]) -> dict[str, Any]:
+        """Summarize a long list by count, range and leading samples."""
+        summary: dict[str, Any] = {"count": len(value)}
+        if all(_is_number(item) for item in value):
+            summary["min"] = min(value)
+            summary["max"] = max(value)
+        summary["samples"] = [self.build(item) for item in value[: self._sample_items]]
+        return summary
+
+    def iter_json(self, value: Any) -> Iterator[str]:
+        """Encode value as redacted JSON, chunk by chunk, without truncation."""
+        if isinstance(value, Mapping):
+            keys = self._keys
+            yield "{"
+            for index, (key, item) in enumerate(value.items()):
+                yield f"{', ' if index else ''}{json.dumps(str(key))}: "
+                if key in keys:
+                    yield _REDACTED_JSON
+                else:
+                    yield from self.iter_json(item)
+            yield "}"
+        elif isinstance(value, list | tuple):
+            yield "["
+            for index, item in enumerate(value):
+                if index:
+                    yield ", "
+                yield from self.iter_json(item)
+            yield "]"
+        else:
+            yield json.dumps(value, default=str)
+
+
+def _loop_blocking(coordinator: YourDomainCoordinator) -> dict[str, Any]:
+    """Summarize the event loop time of the last refreshes in milliseconds."""
+    samples = coordinator.loop_blocking
+    if not samples:
+        return {"refreshes": 0, "offloaded": coordinator.offloaded_refreshes}
+    return {
+        "refreshes": len(samples),
+        "offloaded": coordinator.offloaded_refreshes,
+        "last_ms": round(samples[-1] * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
 
 
 async def async_get_config_entry_diagnostics(
-    hass: Any,
+    hass: HomeAssistant,
     entry: YourDomainConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    builder = DiagnosticsBuilder()
     return {
-        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "data": entry.runtime_data.coordinator.data,
+        "entry": builder.build(entry.as_dict()),
+        "data": builder.build(coordinator.data),
+        "profile": coordinator.last_profile,
+        "loop": _loop_blocking(coordinator),
     }
+
+
+async def async_export_diagnostics(
+    hass: HomeAssistant,
+    entry: YourDomainConfigEntry,
+) -> str:
+    """Stream the full redacted payload of an entry to a file.
+
+    Returns:
+        Path of the written file.
+
+    """
+    coordinator = entry.runtime_data.coordinator
+    # Refreshes publish new dicts instead of changing data in place, so the
+    # executor can stream the current references without a copy
+    payload = {
+        "entry": entry.as_dict(),
+        "data": coordinator.data,
+        "profile": coordinator.last_profile,
+        "loop": _loop_blocking(coordinator),
+    }
+    stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = hass.config.path(f"{DOMAIN}.diagnostics.{entry.entry_id}.{stamp}.json")
+    builder = DiagnosticsBuilder()
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            for chunk in builder.iter_json(payload):
+                file.write(chunk)
+
+    await hass.async_add_executor_job(_write)
+    return path
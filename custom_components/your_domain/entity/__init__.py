@@ -10,13 +10,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from ..const import DOMAIN
 
 if TYPE_CHECKING:
-    from .coordinator import YourDomainCoordinator
+    from homeassistant.helpers.entity import EntityDescription
+
+    from ..coordinator import YourDomainCoordinator
 
 
 class YourDomainEntity(CoordinatorEntity["YourDomainCoordinator"]):
@@ -39,9 +40,7 @@ class YourDomainEntity(CoordinatorEntity["YourDomainCoordinator"]):
         self.entity_description = description
 
         # Bronze: entity-unique-id
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{description.key}"
-        )
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
 
         # Gold: devices - Create device
         self._attr_device_info = DeviceInfo(
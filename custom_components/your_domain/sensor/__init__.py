@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import replace
+from typing import TYPE_CHECKING, cast
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
+from homeassistant.core import callback
 
+from ..const import CONF_DEADBAND, DEFAULT_DEADBAND, SAMPLE_PERCENTILE
 from ..entity import YourDomainEntity
 
 if TYPE_CHECKING:
@@ -17,6 +20,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .. import YourDomainConfigEntry
+    from ..coordinator import YourDomainCoordinator
 
 SENSORS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -26,6 +30,16 @@ SENSORS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+# Sample buffers - Derived from the windowed statistics of every channel
+STATISTIC_SENSORS: tuple[SensorEntityDescription, ...] = tuple(
+    SensorEntityDescription(
+        key=statistic,
+        translation_key=f"sample_{statistic}",
+        state_class=SensorStateClass.MEASUREMENT,
+    )
+    for statistic in ("mean", "min", "max", "percentile", "rate")
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,16 +48,85 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    async_add_entities(
-        YourDomainSensor(coordinator, description)
-        for description in SENSORS
+    entities: list[SensorEntity] = [
+        YourDomainSensor(coordinator, description) for description in SENSORS
+    ]
+    entities.extend(
+        YourDomainStatisticSensor(coordinator, description, channel)
+        for channel in coordinator.data.get("statistics", {})
+        for description in STATISTIC_SENSORS
     )
+    async_add_entities(entities)
 
 
 class YourDomainSensor(YourDomainEntity, SensorEntity):
-    """Sensor entity for Your Domain."""
+    """Sensor entity for Your Domain.
+
+    Changes smaller than the deadband option are not written to the state
+    machine, which keeps noisy values out of the recorder.
+    """
+
+    _last_written: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity was added."""
+        await super().async_added_to_hass()
+        if self.available:
+            self._last_written = self.native_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless the change is within the deadband."""
+        value = self.native_value
+        if not self.available or value is None:
+            self._last_written = None
+        else:
+            deadband = self.coordinator.config_entry.options.get(
+                CONF_DEADBAND, DEFAULT_DEADBAND
+            )
+            if (
+                self._last_written is not None
+                and abs(value - self._last_written) < deadband
+            ):
+                return
+            self._last_written = value
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | None:
         """Return the sensor value."""
         return self.coordinator.data.get("value")
+
+
+class YourDomainStatisticSensor(YourDomainEntity, SensorEntity):
+    """Windowed statistic of one sample channel.
+
+    Channels are discovered from the first refresh; channels that appear
+    later are picked up on the next reload. The deadband is in units of the
+    value sensor and does not apply here.
+    """
+
+    def __init__(
+        self,
+        coordinator: YourDomainCoordinator,
+        description: SensorEntityDescription,
+        channel: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator, replace(description, key=f"{channel}_{description.key}")
+        )
+        self._channel = channel
+        self._statistic = description.key
+        self._attr_translation_placeholders = {
+            "channel": channel,
+            "percentile": str(SAMPLE_PERCENTILE),
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic of the channel's current window."""
+        statistics = self.coordinator.data.get("statistics", {})
+        return cast(
+            "float | None", statistics.get(self._channel, {}).get(self._statistic)
+        )
@@ -0,0 +1,112 @@
+"""Services for Your Domain.
+
+Bronze: action-setup - Services are registered in async_setup.
+Silver: action-exceptions - Services raise translated exceptions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+import voluptuous as vol
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import YourDomainConfigEntry
+
+ATTR_CYCLES = "cycles"
+
+SERVICE_EXPORT_DIAGNOSTICS = "export_diagnostics"
+SERVICE_PROFILE = "profile"
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=3): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+SERVICE_EXPORT_DIAGNOSTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+
+@callback
+def _async_get_loaded_entry(
+    hass: HomeAssistant,
+    entry_id: str,
+) -> YourDomainConfigEntry:
+    """Return a loaded config entry of this domain."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_found",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return entry
+
+
+async def _async_profile(call: ServiceCall) -> None:
+    """Profile the next refresh cycles of a config entry."""
+    entry = _async_get_loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    coordinator = entry.runtime_data.coordinator
+    if coordinator.profiler is not None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="profile_in_progress",
+        )
+    # Import time - cProfile is only loaded when profiling is requested
+    from .coordinator.profiler import YourDomainProfiler
+
+    YourDomainProfiler(call.hass, coordinator, call.data[ATTR_CYCLES]).async_start()
+
+
+async def _async_export_diagnostics(call: ServiceCall) -> ServiceResponse:
+    """Stream the full redacted diagnostics of a config entry to a file."""
+    entry = _async_get_loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+
+    # Import time - Diagnostics are only loaded when requested
+    from .diagnostics import async_export_diagnostics
+
+    return {"path": await async_export_diagnostics(call.hass, entry)}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_DIAGNOSTICS,
+        _async_export_diagnostics,
+        schema=SERVICE_EXPORT_DIAGNOSTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -30,22 +30,30 @@ async def async_setup_entry(
     """Set up switch platform."""
     coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        YourDomainSwitch(coordinator, description)
-        for description in SWITCHES
+        YourDomainSwitch(coordinator, description) for description in SWITCHES
     )
 
 
 class YourDomainSwitch(YourDomainEntity, SwitchEntity):
-    """Switch entity for Your Domain."""
+    """Switch entity for Your Domain.
 
-    _attr_is_on: bool = False
+    The state is read back from the device by the refresh that confirms
+    each command.
+    """
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the state reported by the device."""
+        return self.coordinator.data.get(self.entity_description.key)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        await self.coordinator.async_send_command(
+            self.entity_description.key, {"state": True}
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        await self.coordinator.async_send_command(
+            self.entity_description.key, {"state": False}
+        )
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
-import pytest
 from homeassistant.const import CONF_HOST
+import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.your_domain.const import DOMAIN
 
+from .simulator import DeviceSimulator
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
     enable_custom_integrations: None,
-) -> Generator[None, None, None]:
+) -> None:
     """Enable custom integrations."""
-    yield
 
 
 @pytest.fixture
@@ -32,13 +39,62 @@ def mock_config_entry() -> MockConfigEntry:
 
 
 @pytest.fixture
-def mock_api_client() -> Generator[AsyncMock, None, None]:
+def add_entry(hass: HomeAssistant) -> Callable[..., MockConfigEntry]:
+    """Return a factory that adds a config entry for a device host."""
+
+    def _add_entry(
+        host: str = "dev.sim", title: str = "Test Device"
+    ) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN, data={CONF_HOST: host}, title=title, unique_id=host
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _add_entry
+
+
+@pytest.fixture
+def mock_api_client() -> Generator[AsyncMock]:
     """Create mock API client."""
     with patch(
-        "custom_components.your_domain.api.client.YourDomainApiClient"
+        "custom_components.your_domain.api.registry.YourDomainApiClient"
     ) as mock:
         client = mock.return_value
         client.host = "192.168.1.100"
         client.async_validate_connection = AsyncMock(return_value=True)
-        client.async_get_data = AsyncMock(return_value={"value": 42})
+        client.async_get_data = AsyncMock(return_value=({"value": 42}, 0.0))
         yield client
+
+
+@pytest.fixture
+async def device_simulator(
+    socket_enabled: None,
+) -> AsyncGenerator[DeviceSimulator]:
+    """Start a local device simulator on a real loopback socket."""
+    simulator = DeviceSimulator()
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+async def simulator_session(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+) -> AsyncGenerator[ClientSession]:
+    """Route the integration's websession to the simulator.
+
+    Entries are unloaded before the session closes, so no refresh or probe
+    still running at teardown hits a closed session.
+    """
+    session = device_simulator.create_session()
+    with patch(
+        "custom_components.your_domain.api.registry.async_get_clientsession",
+        return_value=session,
+    ):
+        yield session
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+    await session.close()
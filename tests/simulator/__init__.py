@@ -0,0 +1,18 @@
+"""Local device simulator for Your Domain tests.
+
+Runs an aiohttp server that impersonates any number of devices, with
+configurable latency, payload size, change rate and fault injection.
+"""
+
+from __future__ import annotations
+
+from .device import DeviceProfile, DeviceStats, VirtualDevice
+from .server import DeviceSimulator, SimulatorResolver
+
+__all__ = [
+    "DeviceProfile",
+    "DeviceSimulator",
+    "DeviceStats",
+    "SimulatorResolver",
+    "VirtualDevice",
+]
@@ -0,0 +1,144 @@
+"""Virtual devices served by the simulator."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import random
+import time
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceProfile:
+    """Behavior of a virtual device.
+
+    All rates are probabilities per request in the range 0.0 - 1.0.
+    """
+
+    # Response latency in seconds, plus uniform jitter on top
+    latency: float = 0.0
+    jitter: float = 0.0
+
+    # Bytes of padding added to every /api/data payload
+    payload_size: int = 0
+
+    # Probability that the reported value changes between polls
+    change_rate: float = 1.0
+
+    # Fault injection
+    auth_failure_rate: float = 0.0
+    server_error_rate: float = 0.0
+    timeout_rate: float = 0.0
+
+    # Slow-drip bodies: send the body in chunks with a pause in between
+    drip_chunk_size: int = 0
+    drip_interval: float = 0.0
+
+    # Spacing of samples in the device-side history buffer, in seconds
+    history_interval: int = 60
+
+    # High-rate "power" samples in /api/data: rate in Hz and window in
+    # seconds. A rate of 0 disables the channel.
+    sample_rate: float = 0.0
+    sample_window: int = 60
+
+
+@dataclass(slots=True)
+class DeviceStats:
+    """Request counters of a virtual device."""
+
+    requests: int = 0
+    auth_failures: int = 0
+    server_errors: int = 0
+    timeouts: int = 0
+    by_path: dict[str, int] = field(default_factory=dict)
+    commands: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+
+class VirtualDevice:
+    """A single simulated device.
+
+    The random generator is seeded from the host name, so a given host
+    produces the same sequence of values and faults on every run.
+    """
+
+    def __init__(self, host: str, profile: DeviceProfile, seed: int = 0) -> None:
+        """Initialize the virtual device."""
+        self.host = host
+        self.profile = profile
+        self.stats = DeviceStats()
+        self._random = random.Random(f"{seed}:{host}")  # noqa: S311
+        self.value: float = round(self._random.uniform(0, 100), 2)
+        self.switches: dict[str, bool] = {}
+
+    def next_latency(self) -> float:
+        """Return the latency for the next response."""
+        profile = self.profile
+        return profile.latency + self._random.uniform(0, profile.jitter)
+
+    def roll(self, rate: float) -> bool:
+        """Return True with the given probability."""
+        return rate > 0 and self._random.random() < rate
+
+    def status(self) -> dict[str, Any]:
+        """Return the /api/status payload."""
+        return {"status": "ok", "host": self.host}
+
+    def data(self) -> dict[str, Any]:
+        """Return the /api/data payload, advancing the value."""
+        if self.roll(self.profile.change_rate):
+            self.value = round(self.value + self._random.uniform(-1, 1), 2)
+        payload: dict[str, Any] = {"value": self.value, **self.switches}
+        if self.profile.payload_size:
+            payload["padding"] = "x" * self.profile.payload_size
+        if self.profile.sample_rate:
+            payload["samples"] = {"power": self.samples(time.time())}
+        return payload
+
+    def samples(self, now: float) -> dict[str, Any]:
+        """Return the sample window ending at now.
+
+        Like history, samples are a deterministic function of their
+        timestamp, so overlapping windows agree.
+        """
+        interval = 1 / self.profile.sample_rate
+        count = int(self.profile.sample_window * self.profile.sample_rate)
+        first = (now // interval - count + 1) * interval
+        return {
+            "ts": first,
+            "interval": interval,
+            "values": [
+                round(50 + 25 * math.sin((first + index * interval) / 60), 3)
+                for index in range(count)
+            ],
+        }
+
+    def command(self, name: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Record a command and return the /api/command payload.
+
+        Commands with a "state" argument set the switch of that name.
+        """
+        self.stats.commands.append((name, data))
+        if "state" in data:
+            self.switches[name] = bool(data["state"])
+        return {"status": "ok"}
+
+    def history(
+        self,
+        start: int,
+        end: int,
+        page: int,
+        limit: int,
+    ) -> dict[str, Any]:
+        """Return one page of the /api/history payload.
+
+        Samples are a deterministic function of their timestamp, so pages
+        are stable across requests.
+        """
+        interval = self.profile.history_interval
+        first = -(-start // interval) * interval + page * limit * interval
+        timestamps = range(first, min(end, first + limit * interval), interval)
+        samples = [[ts, round(50 + 25 * math.sin(ts / 3600), 3)] for ts in timestamps]
+        more = first + limit * interval < end
+        return {"samples": samples, "next_page": page + 1 if more else None}
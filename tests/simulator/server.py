@@ -0,0 +1,213 @@
+"""aiohttp server hosting any number of virtual devices in one process.
+
+All virtual hosts share a single listening socket on 127.0.0.1. Sessions
+created by the simulator resolve every host name to that socket, and the
+request's Host header selects the virtual device. This keeps thousands
+of devices on one box without touching the network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import socket
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientSession, TCPConnector, web
+from aiohttp.abc import AbstractResolver, ResolveResult
+
+from .device import DeviceProfile, VirtualDevice
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Requests selected for timeout injection hang for this long
+HANG_SECONDS = 3600
+
+# Seconds stop() waits for in-flight requests before cancelling them
+SHUTDOWN_TIMEOUT = 0.1
+
+
+class SimulatorResolver(AbstractResolver):
+    """Resolve every host name to the simulator socket."""
+
+    def __init__(self, port: int) -> None:
+        """Initialize the resolver."""
+        self._port = port
+
+    async def resolve(
+        self,
+        host: str,
+        port: int = 0,
+        family: socket.AddressFamily = socket.AF_INET,
+    ) -> list[ResolveResult]:
+        """Return the simulator address for any host."""
+        return [
+            ResolveResult(
+                hostname=host,
+                host="127.0.0.1",
+                port=self._port,
+                family=socket.AF_INET,
+                proto=0,
+                flags=socket.AI_NUMERICHOST,
+            )
+        ]
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class DeviceSimulator:
+    """Serve a fleet of virtual devices from a single aiohttp application."""
+
+    def __init__(
+        self,
+        profile: DeviceProfile | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the simulator.
+
+        Args:
+            profile: Default profile for devices added without one.
+            seed: Seed mixed into every device's random generator.
+
+        """
+        self.profile = profile or DeviceProfile()
+        self.devices: dict[str, VirtualDevice] = {}
+        self._seed = seed
+        self._runner: web.AppRunner | None = None
+        self._port = 0
+
+    @property
+    def port(self) -> int:
+        """Return the port the simulator listens on."""
+        return self._port
+
+    def add_device(
+        self,
+        host: str,
+        profile: DeviceProfile | None = None,
+    ) -> VirtualDevice:
+        """Add a virtual device reachable under host."""
+        device = VirtualDevice(host, profile or self.profile, self._seed)
+        self.devices[host] = device
+        return device
+
+    def add_devices(
+        self,
+        count: int,
+        profile: DeviceProfile | None = None,
+    ) -> list[VirtualDevice]:
+        """Add count virtual devices named dev-NNNNN.sim."""
+        start = len(self.devices)
+        return [
+            self.add_device(f"dev-{index:05d}.sim", profile)
+            for index in range(start, start + count)
+        ]
+
+    async def start(self) -> None:
+        """Start listening on a free port on 127.0.0.1."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(
+            app, handle_signals=False, shutdown_timeout=SHUTDOWN_TIMEOUT
+        )
+        await self._runner.setup()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        self._port = sock.getsockname()[1]
+        await web.SockSite(self._runner, sock, backlog=4096).start()
+
+    async def stop(self) -> None:
+        """Stop the server and drop hanging requests."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def create_session(self, limit: int = 0) -> ClientSession:
+        """Create a client session routed to the simulator.
+
+        Args:
+            limit: Connection limit of the session (0 means unlimited).
+
+        """
+        return ClientSession(
+            connector=TCPConnector(
+                resolver=SimulatorResolver(self._port),
+                limit=limit,
+            )
+        )
+
+    def total_requests(self, devices: Iterable[VirtualDevice] | None = None) -> int:
+        """Return the number of requests served to the given devices."""
+        return sum(device.stats.requests for device in devices or self.devices.values())
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Dispatch a request to the virtual device named in the Host header."""
+        host = request.host.rsplit(":", 1)[0]
+        if (device := self.devices.get(host)) is None:
+            raise web.HTTPNotFound
+
+        stats = device.stats
+        stats.requests += 1
+        stats.by_path[request.path] = stats.by_path.get(request.path, 0) + 1
+        profile = device.profile
+
+        if latency := device.next_latency():
+            await asyncio.sleep(latency)
+
+        if device.roll(profile.timeout_rate):
+            stats.timeouts += 1
+            await asyncio.sleep(HANG_SECONDS)
+        if device.roll(profile.auth_failure_rate):
+            stats.auth_failures += 1
+            raise web.HTTPUnauthorized
+        if device.roll(profile.server_error_rate):
+            stats.server_errors += 1
+            raise web.HTTPInternalServerError
+
+        payload = await self._async_payload(device, request)
+        if payload is None:
+            raise web.HTTPNotFound
+
+        if request.method == "HEAD":
+            return web.Response()
+
+        body = json.dumps(payload).encode()
+        if not profile.drip_chunk_size:
+            return web.Response(body=body, content_type="application/json")
+
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.content_length = len(body)
+        await response.prepare(request)
+        # Clients giving up on a slow body close the connection mid-drip
+        with contextlib.suppress(ConnectionResetError):
+            for offset in range(0, len(body), profile.drip_chunk_size):
+                await response.write(body[offset : offset + profile.drip_chunk_size])
+                await asyncio.sleep(profile.drip_interval)
+            await response.write_eof()
+        return response
+
+    async def _async_payload(
+        self, device: VirtualDevice, request: web.Request
+    ) -> dict[str, Any] | None:
+        """Return the payload for a request path, None if it is unknown."""
+        path = request.path
+        if path == "/api/status":
+            return device.status()
+        if path == "/api/data":
+            return device.data()
+        if path == "/api/history":
+            query = request.query
+            return device.history(
+                int(query["start"]),
+                int(query["end"]),
+                int(query.get("page", 0)),
+                int(query.get("limit", 1000)),
+            )
+        if path.startswith("/api/command/") and request.method == "POST":
+            data = await request.json() if request.can_read_body else None
+            return device.command(path.removeprefix("/api/command/"), data or {})
+        return None
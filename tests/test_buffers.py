@@ -0,0 +1,93 @@
+"""Tests for the sample ring buffers."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from custom_components.your_domain.coordinator.buffers import (
+    SampleRingBuffer,
+    YourDomainSampleBuffers,
+    window_statistics,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_ring_buffer_skips_overlap_and_wraps() -> None:
+    buffer = SampleRingBuffer(5)
+
+    assert buffer.extend(100, 1, [1, 2, 3]) == 3
+    assert buffer.extend(101, 1, [2, 3, 4, 5]) == 2
+    assert buffer.extend(104, 1, [5, 6, 7, 8, 9, 10, 11]) == 5
+
+    timestamps, values = buffer.window(100, 110)
+    assert list(timestamps) == [106, 107, 108, 109, 110]
+    assert list(values) == [7, 8, 9, 10, 11]
+    assert list(buffer.window(2, 110)[1]) == [10, 11]
+
+
+def test_ring_buffer_resize_keeps_newest() -> None:
+    buffer = SampleRingBuffer(3)
+    buffer.extend(100, 1, [1, 2, 3, 4])
+
+    buffer.resize(5)
+    buffer.extend(104, 1, [5, 6, 7])
+
+    assert list(buffer.window(100, 106)[1]) == [3, 4, 5, 6, 7]
+
+
+def test_window_statistics() -> None:
+    timestamps, values = [0.0, 1.0, 2.0, 3.0, 4.0], [1.0, 3.0, 5.0, 7.0, 9.0]
+
+    assert window_statistics(timestamps, values, percentile=50) == {
+        "mean": 5.0,
+        "min": 1.0,
+        "max": 9.0,
+        "percentile": 5.0,
+        "rate": 2.0,
+    }
+    assert window_statistics([], []) is None
+
+
+def test_statistics_use_window_only() -> None:
+    buffers = YourDomainSampleBuffers(window=10)
+
+    buffers.ingest({"power": {"ts": 0, "interval": 1, "values": list(range(50))}})
+
+    statistics = buffers.statistics(49)["power"]
+    assert statistics["min"] == 40
+    assert statistics["max"] == 49
+    assert statistics["rate"] == 1.0
+
+
+def test_buffers_hold_a_full_window_at_high_rates() -> None:
+    buffers = YourDomainSampleBuffers(window=300)
+    values = [float(index) for index in range(20 * 300)]
+
+    buffers.ingest({"power": {"ts": 0, "interval": 0.05, "values": values}})
+
+    statistics = buffers.statistics(299.95)["power"]
+    assert statistics["min"] == 0
+    assert statistics["max"] == values[-1]
+
+
+def test_capped_window_is_reported(caplog: pytest.LogCaptureFixture) -> None:
+    buffers = YourDomainSampleBuffers(max_capacity=100, window=10)
+    block = {"ts": 0, "interval": 0.01, "values": list(range(1000))}
+
+    with caplog.at_level(logging.WARNING):
+        buffers.ingest({"power": block})
+        buffers.ingest({"power": block})
+
+    assert caplog.text.count("statistics cover only the last 1.0 s") == 1
+    assert buffers.statistics(9.99)["power"]["min"] == 900
+
+
+def test_stale_samples_leave_the_window() -> None:
+    buffers = YourDomainSampleBuffers(window=10)
+    buffers.ingest({"power": {"ts": 0, "interval": 1, "values": list(range(10))}})
+
+    assert "power" in buffers.statistics(15)
+    assert buffers.statistics(20) == {}
@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 from homeassistant import config_entries
-from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, CONF_TIMEOUT
 from homeassistant.data_entry_flow import FlowResultType
+import pytest
 
-from custom_components.your_domain.const import DOMAIN
+from custom_components.your_domain.api.exceptions import YourDomainApiCommunicationError
+from custom_components.your_domain.api.registry import DATA_CLIENTS, async_get_client
+from custom_components.your_domain.const import CONF_DEADBAND, DOMAIN
+
+from .simulator import DeviceProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .simulator import DeviceSimulator
 
 
 async def test_user_flow_success(hass: HomeAssistant) -> None:
     """Test successful user flow."""
     with patch(
-        "custom_components.your_domain.api.client.YourDomainApiClient"
+        "custom_components.your_domain.api.registry.YourDomainApiClient"
     ) as mock_client:
         mock_client.return_value.async_validate_connection = AsyncMock(
             return_value=True
@@ -35,3 +49,216 @@ async def test_user_flow_success(hass: HomeAssistant) -> None:
         assert result["type"] is FlowResultType.CREATE_ENTRY
         assert result["title"] == "192.168.1.100"
         assert result["data"] == {CONF_HOST: "192.168.1.100"}
+
+
+async def test_user_flow_validates_once(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+) -> None:
+    """Test that setup reuses the validation done by the flow."""
+    device = device_simulator.add_device("dev.sim")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: "dev.sim"},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["result"].state is config_entries.ConfigEntryState.LOADED
+    assert device.stats.by_path["/api/status"] == 1
+
+
+async def test_user_flow_error_releases_client(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+) -> None:
+    """Test that a failed validation does not keep the client."""
+    device_simulator.add_device("locked.sim", DeviceProfile(auth_failure_rate=1.0))
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: "locked.sim"},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+    assert hass.data[DATA_CLIENTS] == {}
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "error"),
+    [
+        (YourDomainApiCommunicationError("offline"), "cannot_connect"),
+        (ValueError("boom"), "unknown"),
+    ],
+)
+async def test_user_flow_errors(
+    hass: HomeAssistant,
+    mock_api_client: AsyncMock,
+    side_effect: Exception,
+    error: str,
+) -> None:
+    """Test that validation errors are mapped to form errors."""
+    mock_api_client.async_validate_connection.side_effect = side_effect
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: "192.168.1.100"},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": error}
+
+
+async def test_reconfigure_host_reloads_retrying_entry(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test that a host change reloads an entry that is retrying setup."""
+    device_simulator.add_device("old.sim", DeviceProfile(timeout_rate=1.0))
+    device = device_simulator.add_device("new.sim")
+    async_get_client(hass, "old.sim").timeout = 0.05
+    entry = add_entry("old.sim")
+    await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is config_entries.ConfigEntryState.SETUP_RETRY
+
+    result = await entry.start_reconfigure_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "new.sim"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.data == {CONF_HOST: "new.sim"}
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    assert entry.runtime_data.client.host == "new.sim"
+    assert set(hass.data[DATA_CLIENTS]) == {"new.sim"}
+    assert device.stats.by_path == {"/api/status": 1, "/api/data": 1}
+
+
+async def test_reconfigure_same_host_does_not_reload(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test that reconfiguring the same host leaves the entry running."""
+    device_simulator.add_device("dev.sim")
+    entry = add_entry("dev.sim")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    result = await entry.start_reconfigure_flow(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "dev.sim"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.runtime_data.coordinator is coordinator
+
+
+async def test_reconfigure_invalid_auth(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test that a rejected host keeps the reconfigure form open."""
+    device_simulator.add_device("dev.sim")
+    device_simulator.add_device("locked.sim", DeviceProfile(auth_failure_rate=1.0))
+    entry = add_entry("dev.sim")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await entry.start_reconfigure_flow(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "locked.sim"}
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+    assert entry.data == {CONF_HOST: "dev.sim"}
+    # The rejected host's client is released, the entry's client is kept
+    assert set(hass.data[DATA_CLIENTS]) == {"dev.sim"}
+
+
+async def test_reauth_flow(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test that reauth revalidates the host before reloading."""
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry("dev.sim")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await entry.start_reauth_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+
+    device.profile = DeviceProfile(auth_failure_rate=1.0)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "dev.sim"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+
+    device.profile = DeviceProfile()
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_HOST: "dev.sim"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+
+
+async def test_options_flow_applies_without_reload(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    """Test that new options reach the running coordinator and client."""
+    device_simulator.add_device("dev.sim")
+    entry = add_entry("dev.sim")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_SCAN_INTERVAL: 60, CONF_TIMEOUT: 5, CONF_DEADBAND: 0.5},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.runtime_data.coordinator is coordinator
+    assert coordinator.update_interval.total_seconds() == 60
+    assert coordinator.client.timeout == 5
@@ -0,0 +1,94 @@
+"""Tests for diagnostics."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_HOST
+
+from custom_components.your_domain.const import DIAGNOSTICS_MAX_STRING
+from custom_components.your_domain.diagnostics import (
+    DiagnosticsBuilder,
+    async_get_config_entry_diagnostics,
+)
+
+from .simulator import DeviceProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .simulator import DeviceSimulator
+
+PAYLOAD = {
+    "host": "192.168.1.100",
+    "value": 42,
+    "samples": list(range(100)),
+    "events": [{"host": "10.0.0.1", "id": index} for index in range(3)],
+    "padding": "x" * 20,
+}
+
+
+def _builder() -> DiagnosticsBuilder:
+    return DiagnosticsBuilder(
+        {"host"},
+        max_items=10,
+        sample_items=3,
+        max_string=8,
+    )
+
+
+def test_build_redacts_and_truncates() -> None:
+    result = _builder().build(PAYLOAD)
+
+    assert result["host"] == REDACTED
+    assert result["value"] == 42
+    assert result["samples"] == {
+        "count": 100,
+        "min": 0,
+        "max": 99,
+        "samples": [0, 1, 2],
+    }
+    assert [event["host"] for event in result["events"]] == [REDACTED] * 3
+    assert result["padding"] == "xxxxxxxx... (20 chars)"
+
+
+def test_iter_json_streams_full_redacted_payload() -> None:
+    result = json.loads("".join(_builder().iter_json(PAYLOAD)))
+
+    assert result == {
+        **PAYLOAD,
+        "host": REDACTED,
+        "events": [{"host": REDACTED, "id": index} for index in range(3)],
+    }
+
+
+async def test_config_entry_diagnostics(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device(
+        "dev.sim", DeviceProfile(payload_size=2 * DIAGNOSTICS_MAX_STRING)
+    )
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert result["entry"]["data"] == {CONF_HOST: REDACTED}
+    assert result["entry"]["title"] == REDACTED
+    assert result["entry"]["unique_id"] == REDACTED
+    assert result["data"]["value"] == device_simulator.devices["dev.sim"].value
+    assert result["data"]["padding"] == (
+        f"{'x' * DIAGNOSTICS_MAX_STRING}... ({2 * DIAGNOSTICS_MAX_STRING} chars)"
+    )
+    assert result["loop"]["refreshes"] == 1
+    assert result["profile"] is None
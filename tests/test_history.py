@@ -0,0 +1,180 @@
+"""Tests for history backfill."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.your_domain.const import DOMAIN
+from custom_components.your_domain.coordinator.history import HourlyAggregator
+
+from .simulator import DeviceProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .simulator import DeviceSimulator
+
+HOUR = 3600
+START = 1_700_000_000 // HOUR * HOUR
+SENSOR = "sensor.test_device_example_sensor"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder,
+    enable_custom_integrations: None,
+) -> None:
+    """Enable custom integrations with the recorder.
+
+    The recorder must be set up before the hass fixture.
+    """
+
+
+def test_hourly_aggregation_across_pages() -> None:
+    aggregator = HourlyAggregator(START, START + 2 * HOUR)
+
+    aggregator.add([[START, 1.0], [START + 60, 3.0]])
+    aggregator.add([[START + 120, 2.0], [START + HOUR, 10.0]])
+
+    statistics = aggregator.statistics()
+
+    assert len(statistics) == 2
+    assert statistics[0]["start"] == datetime.fromtimestamp(START, tz=UTC)
+    assert statistics[0]["mean"] == 2.0
+    assert statistics[0]["min"] == 1.0
+    assert statistics[0]["max"] == 3.0
+    assert statistics[1]["mean"] == 10.0
+
+
+def test_samples_outside_window_are_ignored() -> None:
+    aggregator = HourlyAggregator(START, START + HOUR)
+
+    aggregator.add([[START - 1, 5.0], [START + HOUR, 5.0]])
+
+    assert aggregator.statistics() == []
+
+
+async def _hourly_statistics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    await async_wait_recording_done(hass)
+    statistics = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime.fromtimestamp(0, tz=UTC),
+        None,
+        {SENSOR},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    return statistics.get(SENSOR, [])
+
+
+async def test_overlapping_backfills_import_each_hour_once(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    freezer.move_to(datetime.fromtimestamp(START + 3 * HOUR + 1800, tz=UTC))
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    history = entry.runtime_data.coordinator.history
+
+    with patch.object(
+        history.client, "async_get_history", wraps=history.client.async_get_history
+    ) as get_history:
+        await history.async_backfill(datetime.fromtimestamp(START + 900, tz=UTC))
+        freezer.tick(2 * HOUR)
+        await history.async_backfill(datetime.fromtimestamp(START + HOUR, tz=UTC))
+
+    # The second window overlaps the first, only the new hours are fetched
+    assert [call.args[:2] for call in get_history.call_args_list] == [
+        (START, START + 3 * HOUR),
+        (START + 3 * HOUR, START + 5 * HOUR),
+    ]
+    assert hass_storage[f"{DOMAIN}.{entry.entry_id}.history"]["data"] == {
+        "cursor": START + 5 * HOUR
+    }
+
+    statistics = await _hourly_statistics(hass)
+    assert [row["start"] for row in statistics] == [
+        START + index * HOUR for index in range(5)
+    ]
+    for row in statistics:
+        hour = int(row["start"])
+        values = [
+            value for _, value in device.history(hour, hour + HOUR, 0, 1000)["samples"]
+        ]
+        assert row["mean"] == pytest.approx(sum(values) / len(values))
+        assert row["min"] == min(values)
+        assert row["max"] == max(values)
+
+
+async def test_persisted_cursor_is_loaded(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    freezer.move_to(datetime.fromtimestamp(START + 2 * HOUR, tz=UTC))
+    device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.history"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}.history",
+        "data": {"cursor": START + 2 * HOUR},
+    }
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    history = entry.runtime_data.coordinator.history
+
+    assert history.cursor == START + 2 * HOUR
+    await history.async_backfill(datetime.fromtimestamp(START, tz=UTC))
+    assert await _hourly_statistics(hass) == []
+
+
+async def test_server_error_outage_is_backfilled(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    freezer.move_to(datetime.fromtimestamp(START + 1800, tz=UTC))
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    device.profile = DeviceProfile(server_error_rate=1.0)
+    await coordinator.async_refresh()
+    freezer.tick(2 * HOUR)
+    device.profile = DeviceProfile()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert device.stats.by_path["/api/history"] == 1
+    statistics = await _hourly_statistics(hass)
+    assert [row["start"] for row in statistics] == [START, START + HOUR]
@@ -0,0 +1,90 @@
+"""Import-time budget for the integration package."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+PACKAGE = "custom_components.your_domain"
+
+# Time our own modules may add on top of an already running Home Assistant,
+# measured at 14-17 ms as the best of IMPORT_RUNS fresh imports. Timing is
+# noisy, the module baseline below is exact.
+IMPORT_BUDGET_MS = 25
+IMPORT_RUNS = 3
+
+# Modules outside the package that importing it may load on top of BASELINE.
+# Any new entry is an import-time regression and must be added deliberately.
+EXTERNAL_MODULES: tuple[str, ...] = ()
+
+# Modules Home Assistant has loaded before it imports the integration
+BASELINE = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+
+# Modules that must only load when the feature using them is needed
+LAZY = (
+    f"{PACKAGE}.binary_sensor",
+    f"{PACKAGE}.button",
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.coordinator.profiler",
+    f"{PACKAGE}.diagnostics",
+    f"{PACKAGE}.sensor",
+    f"{PACKAGE}.switch",
+    "cProfile",
+    "homeassistant.components.diagnostics",
+    "homeassistant.components.recorder.statistics",
+)
+
+SCRIPT = f"""
+import json, sys
+import {", ".join(BASELINE)}
+before = set(sys.modules)
+import {PACKAGE}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def _import_package() -> tuple[int, list[str]]:
+    """Import the package in a fresh interpreter.
+
+    Returns the cumulative import time of the package in microseconds
+    and the modules the import loaded on top of BASELINE.
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == PACKAGE
+    )
+    return cumulative, json.loads(result.stdout)
+
+
+def test_import_budget() -> None:
+    runs = [_import_package() for _ in range(IMPORT_RUNS)]
+    cumulative = min(run[0] for run in runs)
+    loaded = runs[0][1]
+
+    assert sorted(set(LAZY) & set(loaded)) == []
+    external = [
+        module
+        for module in loaded
+        if module != "custom_components" and not module.startswith(PACKAGE)
+    ]
+    assert tuple(external) == EXTERNAL_MODULES
+    assert cumulative / 1000 < IMPORT_BUDGET_MS
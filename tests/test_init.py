@@ -0,0 +1,488 @@
+"""End-to-end tests for setup against the device simulator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.your_domain.api.priority import RequestPriority
+from custom_components.your_domain.const import (
+    CONF_DEADBAND,
+    DOMAIN,
+    PROBE_INTERVAL,
+    SAMPLE_PERCENTILE,
+)
+
+from .simulator import DeviceProfile, DeviceSimulator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+SENSOR = "sensor.test_device_example_sensor"
+CONNECTIVITY = "binary_sensor.test_device_connectivity"
+
+
+async def test_setup_entry(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert float(hass.states.get(SENSOR).state) == device.value
+    assert device.stats.by_path == {"/api/status": 1, "/api/data": 1}
+
+
+async def test_setup_entry_auth_failed(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device("dev.sim", DeviceProfile(auth_failure_rate=1.0))
+    entry = add_entry()
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+
+
+async def test_poll_server_error_marks_unavailable(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    device.profile = DeviceProfile(server_error_rate=1.0)
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(SENSOR).state == STATE_UNAVAILABLE
+    assert device.stats.server_errors == 1
+
+
+@pytest.mark.slow
+async def test_fleet_setup(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    devices = device_simulator.add_devices(
+        250, DeviceProfile(latency=0.05, jitter=0.05, payload_size=4096)
+    )
+    entries = [add_entry(device.host, device.host) for device in devices]
+
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    assert device_simulator.total_requests(devices) == 2 * len(devices)
+
+
+async def test_options_applied_without_reload(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={CONF_SCAN_INTERVAL: 120, CONF_TIMEOUT: 3, CONF_DEADBAND: 0.5},
+    )
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.coordinator is coordinator
+    assert coordinator.update_interval == timedelta(seconds=120)
+    assert coordinator.client.timeout == 3
+    assert device.stats.by_path["/api/status"] == 1
+
+
+async def test_deadband_applies_to_value_sensor_only(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device(
+        "dev.sim", DeviceProfile(change_rate=0.0, sample_rate=1.0)
+    )
+    entry = add_entry()
+    hass.config_entries.async_update_entry(entry, options={CONF_DEADBAND: 0.5})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    written = device.value
+    mean = "sensor.test_device_power_mean"
+
+    device.value = round(written + 0.4, 2)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get(SENSOR).state) == written
+    assert hass.states.get(mean).last_reported > hass.states.get(SENSOR).last_reported
+
+    device.value = round(written + 0.6, 2)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get(SENSOR).state) == device.value
+
+
+async def _async_probe_tick(hass: HomeAssistant) -> None:
+    """Fire the probe timer and wait for the probe to finish."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=PROBE_INTERVAL))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_liveness_probe_pauses_and_resumes_polling(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    device.profile = DeviceProfile(server_error_rate=1.0)
+    for _ in range(2):
+        await _async_probe_tick(hass)
+
+    assert hass.states.get(CONNECTIVITY).state == STATE_OFF
+    assert hass.states.get(SENSOR).state == STATE_UNAVAILABLE
+    assert device.stats.by_path == {"/api/status": 3, "/api/data": 1}
+
+    device.profile = DeviceProfile()
+    await _async_probe_tick(hass)
+
+    assert hass.states.get(CONNECTIVITY).state == STATE_ON
+    assert float(hass.states.get(SENSOR).state) == device.value
+    assert device.stats.by_path == {"/api/status": 4, "/api/data": 2}
+
+
+async def test_liveness_probe_waits_for_busy_device(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    # The poll outlasts the probe timeout, the probe must wait for it
+    device.profile = DeviceProfile(latency=0.2)
+    with patch.object(coordinator.client, "_probe_timeout", 0.1):
+        refresh = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        await _async_probe_tick(hass)
+        await refresh
+
+    assert entry.runtime_data.probe._failures == 0
+    assert hass.states.get(CONNECTIVITY).state == STATE_ON
+    # The poll answered the probe, no HEAD request was sent
+    assert device.stats.by_path == {"/api/status": 1, "/api/data": 2}
+
+
+async def test_unload_cancels_probe_in_flight(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    probe = entry.runtime_data.probe
+
+    device.profile = DeviceProfile(latency=1.0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=PROBE_INTERVAL))
+    await asyncio.sleep(0)
+    task = probe._task
+    assert task is not None
+    assert not task.done()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert task.cancelled()
+    assert probe.is_alive
+
+
+async def test_sample_channels_create_statistic_sensors(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device("dev.sim", DeviceProfile(sample_rate=1.0))
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert "samples" not in entry.runtime_data.coordinator.data
+    mean = float(hass.states.get("sensor.test_device_power_mean").state)
+    minimum = float(hass.states.get("sensor.test_device_power_minimum").state)
+    maximum = float(hass.states.get("sensor.test_device_power_maximum").state)
+    assert minimum <= mean <= maximum
+    percentile = hass.states.get(
+        f"sensor.test_device_power_{SAMPLE_PERCENTILE}th_percentile"
+    )
+    assert percentile.name == f"Test Device power {SAMPLE_PERCENTILE}th percentile"
+
+
+async def test_large_payload_processed_in_executor(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device(
+        "dev.sim",
+        DeviceProfile(payload_size=100_000, sample_rate=100.0, sample_window=60),
+    )
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    assert coordinator.offloaded_refreshes == 1
+    assert list(coordinator.loop_blocking) == [0.0]
+    assert "power" in coordinator.data["statistics"]
+
+
+@pytest.mark.parametrize("payload", [[42], None])
+async def test_malformed_payload_fails_refresh(
+    hass: HomeAssistant,
+    payload: Any,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    with patch.object(
+        coordinator.client, "async_get_data", return_value=(payload, 0.0)
+    ):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.last_exception.translation_key == "invalid_response"
+    assert hass.states.get(SENSOR).state == STATE_UNAVAILABLE
+
+
+async def test_slow_drip_body_times_out(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    # Headers arrive at once, the body keeps dripping past the timeout
+    device.profile = DeviceProfile(
+        payload_size=100, drip_chunk_size=10, drip_interval=0.05
+    )
+    coordinator.client.timeout = 0.1
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.last_exception.translation_key == "cannot_connect"
+    assert hass.states.get(SENSOR).state == STATE_UNAVAILABLE
+
+
+async def test_button_and_switch_send_commands(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    switch = "switch.test_device_example_switch"
+    assert hass.states.get(switch).state == STATE_UNKNOWN
+
+    await hass.services.async_call(
+        "button", "press", {"entity_id": "button.test_device_restart"}, blocking=True
+    )
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": switch}, blocking=True
+    )
+    assert hass.states.get(switch).state == STATE_ON
+
+    await hass.services.async_call(
+        "switch", "turn_off", {"entity_id": switch}, blocking=True
+    )
+    assert hass.states.get(switch).state == STATE_OFF
+
+    assert device.stats.commands == [
+        ("restart", {}),
+        ("example_switch", {"state": True}),
+        ("example_switch", {"state": False}),
+    ]
+
+
+async def test_confirm_priority_does_not_leak_into_polls(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    client = coordinator.client
+
+    with patch.object(
+        client, "async_get_data", wraps=client.async_get_data
+    ) as get_data:
+        await coordinator.async_send_command("restart")
+        await coordinator.async_refresh()
+
+    assert [call.args for call in get_data.call_args_list] == [
+        (RequestPriority.CONFIRM,),
+        (RequestPriority.POLL,),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("profile", "translation_key"),
+    [
+        (DeviceProfile(server_error_rate=1.0), "command_failed"),
+        (DeviceProfile(auth_failure_rate=1.0), "auth_failed"),
+    ],
+)
+async def test_rejected_command_raises(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    profile: DeviceProfile,
+    translation_key: str,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    device.profile = profile
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            "switch",
+            "turn_on",
+            {"entity_id": "switch.test_device_example_switch"},
+            blocking=True,
+        )
+
+    assert exc_info.value.translation_key == translation_key
+    assert hass.states.get("switch.test_device_example_switch").state == STATE_UNKNOWN
+
+
+async def test_auth_failure_starts_reauth(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    device.profile = DeviceProfile(auth_failure_rate=1.0)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.last_exception.translation_key == "auth_failed"
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert [flow["context"]["source"] for flow in flows] == ["reauth"]
+
+
+async def test_outage_is_not_backfilled_without_recorder(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    freezer.move_to(datetime(2024, 1, 1, 0, 30, tzinfo=UTC))
+    device = device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    assert "recorder" not in hass.config.components
+    device.profile = DeviceProfile(server_error_rate=1.0)
+    await coordinator.async_refresh()
+    freezer.tick(timedelta(hours=2))
+    device.profile = DeviceProfile()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.last_update_success
+    assert "/api/history" not in device.stats.by_path
@@ -0,0 +1,92 @@
+"""Tests for the per-device request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.your_domain.api.priority import RequestPriority, RequestScheduler
+
+
+async def test_command_preempts_in_flight_poll() -> None:
+    scheduler = RequestScheduler()
+    log: list[str] = []
+    polling = asyncio.Event()
+    release = asyncio.Event()
+
+    async def poll() -> str:
+        log.append("poll")
+        polling.set()
+        await release.wait()
+        return "data"
+
+    async def command() -> str:
+        log.append("command")
+        return "ok"
+
+    poll_task = asyncio.create_task(scheduler.async_run(RequestPriority.POLL, poll))
+    await polling.wait()
+    polling.clear()
+
+    # The poll never finishes on its own, the command must preempt it
+    assert await scheduler.async_run(RequestPriority.COMMAND, command) == "ok"
+    await polling.wait()
+    assert log == ["poll", "command", "poll"]
+
+    release.set()
+    assert await poll_task == "data"
+
+
+async def test_waiters_served_by_priority() -> None:
+    scheduler = RequestScheduler()
+    order: list[RequestPriority] = []
+    gate = asyncio.Event()
+
+    async def request(priority: RequestPriority) -> None:
+        order.append(priority)
+        await gate.wait()
+
+    busy = asyncio.create_task(
+        scheduler.async_run(
+            RequestPriority.CONFIRM, lambda: request(RequestPriority.CONFIRM)
+        )
+    )
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(
+            scheduler.async_run(priority, lambda priority=priority: request(priority))
+        )
+        for priority in (RequestPriority.POLL, RequestPriority.CONFIRM)
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(busy, *waiters)
+
+    assert order == [
+        RequestPriority.CONFIRM,
+        RequestPriority.CONFIRM,
+        RequestPriority.POLL,
+    ]
+
+
+async def test_cancelled_caller_is_not_retried() -> None:
+    scheduler = RequestScheduler()
+    started = asyncio.Event()
+    calls = 0
+
+    async def request() -> None:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.Event().wait()
+
+    task = asyncio.create_task(scheduler.async_run(RequestPriority.POLL, request))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    result = await scheduler.async_run(RequestPriority.POLL, lambda: asyncio.sleep(0))
+    assert result is None
+    assert calls == 1
@@ -0,0 +1,139 @@
+"""Tests for the staggered poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from homeassistant.setup import async_setup_component
+import pytest
+
+from custom_components.your_domain.const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_REFRESHES,
+)
+from custom_components.your_domain.coordinator.scheduler import YourDomainPollScheduler
+
+from .simulator import DeviceProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .simulator import DeviceSimulator
+
+ENTRY_IDS = [f"entry_{index}" for index in range(6)]
+
+
+def test_phases_spread_evenly_and_deterministically() -> None:
+    forward = YourDomainPollScheduler()
+    backward = YourDomainPollScheduler()
+    for entry_id in ENTRY_IDS:
+        forward.async_register(entry_id, Mock())
+    for entry_id in reversed(ENTRY_IDS):
+        backward.async_register(entry_id, Mock())
+
+    phases = sorted(forward.phase(entry_id) for entry_id in ENTRY_IDS)
+
+    assert phases == [index / len(ENTRY_IDS) for index in range(len(ENTRY_IDS))]
+    assert all(
+        forward.phase(entry_id) == backward.phase(entry_id) for entry_id in ENTRY_IDS
+    )
+
+
+def test_rebalance_on_unregister() -> None:
+    scheduler = YourDomainPollScheduler()
+    first = Mock()
+    second = Mock()
+    scheduler.async_register("first", first)
+    unregister = scheduler.async_register("second", second)
+    first.reset_mock()
+
+    unregister()
+
+    first.assert_called_once()
+    assert scheduler.phase("first") == 0.0
+
+
+def test_next_refresh_lands_on_phase() -> None:
+    scheduler = YourDomainPollScheduler()
+    scheduler.async_register("first", Mock())
+    scheduler.async_register("second", Mock())
+    offset = scheduler.phase("second") * 30
+
+    next_refresh = scheduler.next_refresh("second", 1000.0, 30)
+
+    assert 1000.0 < next_refresh <= 1030.0
+    assert (next_refresh - offset) % 30 == 0
+
+
+async def test_coordinators_poll_at_staggered_phases(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    devices = device_simulator.add_devices(4)
+    entries = [add_entry(device.host, device.host) for device in devices]
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    coordinators = [entry.runtime_data.coordinator for entry in entries]
+    now = hass.loop.time()
+
+    # First slots lie one interval after setup, spread evenly over it
+    slots = sorted(coordinator._next_slot for coordinator in coordinators)
+    assert all(
+        now + DEFAULT_SCAN_INTERVAL < slot <= now + 2 * DEFAULT_SCAN_INTERVAL
+        for slot in slots
+    )
+    assert [b - a for a, b in itertools.pairwise(slots)] == pytest.approx(
+        [DEFAULT_SCAN_INTERVAL / len(devices)] * (len(devices) - 1)
+    )
+
+    # A fired slot polls once and moves on by exactly one interval
+    coordinator = coordinators[0]
+    slot = coordinator._next_slot
+    coordinator._async_handle_scheduled_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert devices[0].stats.by_path["/api/data"] == 2
+    assert coordinator._next_slot == slot + DEFAULT_SCAN_INTERVAL
+
+
+async def test_slow_refreshes_hold_their_slot(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> None:
+    devices = device_simulator.add_devices(MAX_CONCURRENT_REFRESHES + 1)
+    entries = [add_entry(device.host, device.host) for device in devices]
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    *hanging, waiting = entries
+    for device in devices[:-1]:
+        device.profile = DeviceProfile(timeout_rate=1.0)
+    for entry in hanging:
+        entry.runtime_data.client.timeout = 0.2
+        entry.async_create_background_task(
+            hass, entry.runtime_data.coordinator._async_staggered_refresh(), "hang"
+        )
+    refresh = hass.async_create_task(
+        waiting.runtime_data.coordinator._async_staggered_refresh()
+    )
+
+    # Every slot is taken by a refresh that is still waiting for its device
+    await asyncio.sleep(0.1)
+    assert not refresh.done()
+    assert devices[-1].stats.by_path["/api/data"] == 1
+
+    # The slots free up once the hanging refreshes time out
+    await asyncio.wait_for(refresh, 1)
+    assert devices[-1].stats.by_path["/api/data"] == 2
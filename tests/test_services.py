@@ -0,0 +1,180 @@
+"""Tests for services."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, CONF_HOST
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from custom_components.your_domain.const import DOMAIN, PROFILE_KEEP_RUNS
+
+from .simulator import DeviceProfile
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from .simulator import DeviceSimulator
+
+
+@pytest.fixture
+async def loaded_entry(
+    hass: HomeAssistant,
+    device_simulator: DeviceSimulator,
+    simulator_session: ClientSession,
+    add_entry: Callable[..., MockConfigEntry],
+) -> MockConfigEntry:
+    device_simulator.add_device("dev.sim")
+    entry = add_entry()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_profile(
+    hass: HomeAssistant, tmp_path: Path, loaded_entry: MockConfigEntry
+) -> None:
+    hass.config.config_dir = str(tmp_path)
+    coordinator = loaded_entry.runtime_data.coordinator
+
+    await hass.services.async_call(
+        DOMAIN,
+        "profile",
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id, "cycles": 2},
+        blocking=True,
+    )
+    assert coordinator.profiler is not None
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.profiler is None
+    assert "_async_update_data" not in vars(coordinator)
+    profile = coordinator.last_profile
+    assert profile["cycles"] == 2
+    assert set(profile["phases"]) == {
+        "network",
+        "decode",
+        "processing",
+        "dispatch",
+        "total",
+    }
+    assert Path(profile["stats_file"]).parent == tmp_path
+    assert Path(profile["stats_file"]).is_file()
+    assert Path(profile["breakdown_file"]).is_file()
+
+
+async def test_profile_keeps_newest_runs(
+    hass: HomeAssistant, tmp_path: Path, loaded_entry: MockConfigEntry
+) -> None:
+    hass.config.config_dir = str(tmp_path)
+    prefix = f"{DOMAIN}.profile.{loaded_entry.entry_id}"
+    old = [f"20200101T00000{index}" for index in range(PROFILE_KEEP_RUNS)]
+    for stamp in old:
+        (tmp_path / f"{prefix}.{stamp}.cprof").touch()
+        (tmp_path / f"{prefix}.{stamp}.json").touch()
+    other = tmp_path / f"{DOMAIN}.profile.other.20200101T000000.cprof"
+    other.touch()
+
+    await hass.services.async_call(
+        DOMAIN,
+        "profile",
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id, "cycles": 1},
+        blocking=True,
+    )
+    await loaded_entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    stamps = {path.name.split(".")[3] for path in tmp_path.glob(f"{prefix}.*")}
+    assert len(stamps) == PROFILE_KEEP_RUNS
+    assert old[0] not in stamps
+    assert other.is_file()
+
+
+async def test_profile_ignores_requests_outside_the_cycle(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    device_simulator: DeviceSimulator,
+    loaded_entry: MockConfigEntry,
+) -> None:
+    hass.config.config_dir = str(tmp_path)
+    device_simulator.devices["dev.sim"].profile = DeviceProfile(latency=0.1)
+    coordinator = loaded_entry.runtime_data.coordinator
+    client = coordinator.client
+    await hass.services.async_call(
+        DOMAIN,
+        "profile",
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id, "cycles": 1},
+        blocking=True,
+    )
+    profiler = coordinator.profiler
+    assert profiler is not None
+
+    # Another caller of the shared client finishes while the cycle waits
+    other = hass.async_create_task(client._async_request("GET", "/api/status"))
+    await asyncio.sleep(0)
+    refresh = hass.async_create_task(coordinator.async_refresh())
+    await other
+    assert profiler._current == {}
+
+    await refresh
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.last_profile is not None
+
+
+async def test_profile_unknown_entry(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {ATTR_CONFIG_ENTRY_ID: "unknown"},
+            blocking=True,
+        )
+
+
+async def test_export_diagnostics(
+    hass: HomeAssistant, tmp_path: Path, loaded_entry: MockConfigEntry
+) -> None:
+    hass.config.config_dir = str(tmp_path)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "export_diagnostics",
+        {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+
+    path = Path(response["path"])
+    assert path.parent == tmp_path
+    result = json.loads(path.read_text(encoding="utf-8"))
+    assert result["entry"]["data"] == {CONF_HOST: REDACTED}
+    assert result["data"] == loaded_entry.runtime_data.coordinator.data
+
+
+async def test_export_diagnostics_entry_not_loaded(
+    hass: HomeAssistant, loaded_entry: MockConfigEntry
+) -> None:
+    assert await hass.config_entries.async_unload(loaded_entry.entry_id)
+
+    with pytest.raises(ServiceValidationError) as exc_info:
+        await hass.services.async_call(
+            DOMAIN,
+            "export_diagnostics",
+            {ATTR_CONFIG_ENTRY_ID: loaded_entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )
+    assert exc_info.value.translation_key == "entry_not_loaded"